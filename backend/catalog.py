@@ -0,0 +1,376 @@
+"""
+Снимок каталога комплектующих в памяти.
+
+Снимок загружается один раз при старте приложения и отдаётся всеми
+читающими роутерами, поэтому время ответа не зависит от SQLite и
+создания ORM-объектов. Снимок неизменяемый: при записи через API или
+при изменении файла БД на диске строится новый снимок и подменяется
+одной операцией присваивания.
+"""
+import asyncio
+import heapq
+import logging
+import os
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+from backend.compression import cached_response
+from backend.database.models import Component, CPU, GPU, PSU, RAM, Storage, Cooling, Drive, Motherboard
+from backend.database.versions import GLOBAL, load_versions
+from backend.typeahead import NameIndex
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = {
+    "cpus": CPU,
+    "gpus": GPU,
+    "psus": PSU,
+    "ram": RAM,
+    "storages": Storage,
+    "cooling": Cooling,
+    "drives": Drive,
+    "motherboards": Motherboard,
+}
+
+WATCH_INTERVAL = 2.0
+
+
+def category_row(model, name: str, raw_value, watts) -> Dict[str, Any]:
+    """Запись components в колонках модели категории, как её отдаёт представление"""
+    value = model.__value_column__
+    if "watts" in model.__table__.columns:
+        values = {"name": name, value: raw_value, "watts": watts}
+    else:
+        values = {"name": name, value: watts}
+    return {column: values[column] for column in model.__table__.columns.keys()}
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    columns: Tuple[str, ...]
+    rows: Tuple[Mapping[str, Any], ...]
+    by_name: Mapping[str, Mapping[str, Any]]
+    # Записи, отсортированные по первичному ключу, для keyset-пагинации
+    name_ordered: Tuple[Mapping[str, Any], ...]
+    names_sorted: Tuple[str, ...]
+    # Записи с известной мощностью, отсортированные по watts, и сами значения для bisect
+    by_watts: Tuple[Mapping[str, Any], ...]
+    watts_sorted: Tuple[int, ...]
+    # Индекс подсказок (GET /search) и подстрок (search, find) по названиям rows
+    index: NameIndex
+
+    @classmethod
+    def build(cls, columns: Sequence[str], rows) -> "CategorySnapshot":
+        frozen = tuple(MappingProxyType(dict(row)) for row in rows)
+        name_ordered = tuple(sorted(frozen, key=lambda row: row["name"]))
+        index = NameIndex([row["name"] for row in frozen])
+        index.build_substrings()
+        by_watts = tuple(sorted(
+            (row for row in frozen if row.get("watts") is not None),
+            key=lambda row: row["watts"],
+        ))
+        return cls(
+            columns=tuple(columns),
+            rows=frozen,
+            by_name=MappingProxyType({row["name"]: row for row in frozen}),
+            name_ordered=name_ordered,
+            names_sorted=tuple(row["name"] for row in name_ordered),
+            by_watts=by_watts,
+            watts_sorted=tuple(row["watts"] for row in by_watts),
+            index=index,
+        )
+
+    @cached_property
+    def watts_array(self) -> np.ndarray:
+        """watts_sorted в виде массива NumPy для векторного searchsorted"""
+        return np.asarray(self.watts_sorted, dtype=np.int64)
+
+    def at_least(self, min_watts: int, limit: int, max_watts: Optional[int] = None):
+        """k записей с наименьшей мощностью не ниже min_watts за O(log n + k)"""
+        lo = bisect_left(self.watts_sorted, min_watts)
+        hi = lo + limit
+        if max_watts is not None:
+            hi = min(hi, bisect_right(self.watts_sorted, max_watts, lo))
+        return self.by_watts[lo:hi]
+
+    def page(self, after: Optional[str] = None, limit: Optional[int] = None,
+             fields: Optional[Sequence[str]] = None) -> Tuple[List[Mapping[str, Any]], Optional[str]]:
+        """
+        Страница записей и ключ для следующей страницы.
+
+        Без after/limit возвращает все записи в исходном порядке, иначе
+        записи идут по возрастанию name, начиная сразу после after.
+        fields ограничивает набор возвращаемых колонок.
+        """
+        if fields:
+            unknown = [f for f in fields if f not in self.columns]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        next_after = None
+        if after is None and limit is None:
+            rows = self.rows
+        else:
+            start = bisect_right(self.names_sorted, after) if after is not None else 0
+            end = start + limit if limit is not None else len(self.name_ordered)
+            rows = self.name_ordered[start:end]
+            if limit is not None and end < len(self.name_ordered) and rows:
+                next_after = rows[-1]["name"]
+
+        if fields:
+            return [{f: row[f] for f in fields} for row in rows], next_after
+        return list(rows), next_after
+
+    def search(self, query: str):
+        """Все записи, в названии которых встречается подстрока (без учёта регистра)"""
+        return [self.rows[position] for position in self.index.containing(query)]
+
+    def find(self, name: Optional[str]):
+        """Точное совпадение по названию, иначе первое вхождение подстроки"""
+        if not name:
+            return None
+        row = self.by_name.get(name)
+        if row is not None:
+            return row
+        position = self.index.first_containing(name)
+        return self.rows[position] if position is not None else None
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    versions: Mapping[str, int]
+    categories: Mapping[str, CategorySnapshot]
+    # Сериализованные и сжатые ответы, действительные только для этой версии
+    responses: Dict[Any, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    def __getitem__(self, category: str) -> CategorySnapshot:
+        return self.categories[category]
+
+    @property
+    def version(self) -> int:
+        return self.versions.get(GLOBAL, 0)
+
+    def etag(self, category: Optional[str] = None) -> str:
+        """Сильный ETag версии категории (или всего каталога, если category не указана)"""
+        if category is None:
+            return f'"catalog-{self.version}"'
+        return f'"{category}-{self.versions.get(category, 0)}"'
+
+    def typeahead(self, query: str, category: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Подсказки по названию: сначала совпадения с началом названия,
+        затем с началами слов; внутри групп — короткие названия выше.
+        """
+        if category is not None and category not in self.categories:
+            raise ValueError(f"Unknown category: {category}")
+        categories = [category] if category is not None else list(self.categories)
+        hits = heapq.merge(*(
+            [(key, c, position) for key, position in self.categories[c].index.search(query, limit)]
+            for c in categories
+        ))
+        return [{"category": c, **self.categories[c].rows[position]} for _, c, position in islice(hits, limit)]
+
+    def bundle(self) -> Dict[str, Any]:
+        """
+        Весь каталог одним ответом в колоночном виде: для каждой категории
+        параллельные массивы names и watts, отсортированные по названию.
+        """
+        data = {}
+        for category, snapshot in self.categories.items():
+            rows = snapshot.name_ordered
+            data[category] = {
+                "names": list(snapshot.names_sorted),
+                # У категорий без колонки watts consumption — целое число ватт
+                "watts": [row["watts"] if "watts" in row else row["consumption"] for row in rows],
+            }
+        return {"success": True, "version": self.version, "data": data}
+
+    def bundle_response(self, request):
+        """bundle() из буфера, который сериализуется и сжимается один раз на версию каталога"""
+        return cached_response(request, self.responses, ("bundle",), self.bundle, headers={"ETag": self.etag()})
+
+    def list_response(self, request, category: str):
+        """Полный список категории из заранее сериализованного и сжатого буфера"""
+        return cached_response(
+            request, self.responses, ("list", category),
+            lambda: {"success": True, "data": self.categories[category].rows, "next_after": None},
+            headers={"ETag": self.etag(category)},
+        )
+
+
+class CatalogStore:
+    """Держит актуальный снимок каталога и перестраивает его при изменениях"""
+
+    def __init__(self, session_maker, db_path: str, watch_interval: float = WATCH_INTERVAL):
+        self._session_maker = session_maker
+        self._db_path = db_path
+        self._watch_interval = watch_interval
+        self._snapshot = CatalogSnapshot(versions=MappingProxyType({}), categories=MappingProxyType({
+            category: CategorySnapshot.build(model.__table__.columns.keys(), ())
+            for category, model in CATEGORIES.items()
+        }))
+        self._signature = None
+        self._lock = asyncio.Lock()
+        self._watcher: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        return self._snapshot
+
+    def _file_signature(self):
+        signature = []
+        for path in (self._db_path, self._db_path + "-wal"):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    @staticmethod
+    def _build(rows: Dict[str, List[Tuple[str, Any, Any]]]) -> Dict[str, CategorySnapshot]:
+        """Снимки категорий из записей components; выполняется в отдельном потоке"""
+        return {
+            category: CategorySnapshot.build(
+                CATEGORIES[category].__table__.columns.keys(),
+                [category_row(CATEGORIES[category], *row) for row in category_rows],
+            )
+            for category, category_rows in rows.items()
+        }
+
+    async def reload(self, full: bool = False) -> CatalogSnapshot:
+        """
+        Загрузить из БД изменившиеся категории и атомарно подменить снимок.
+
+        Перестраиваются категории, версия которых отличается от версии в
+        текущем снимке; full — все категории (первая загрузка, изменение
+        файла БД в обход API, которое не меняет версий). Снимки категорий
+        строятся в отдельном потоке, чтобы не останавливать обработку
+        запросов на время перестройки.
+        """
+        async with self._lock:
+            signature = self._file_signature()
+            current = self._snapshot
+            full = full or self._signature is None
+            # Все чтения идут в одной транзакции, поэтому версии соответствуют данным
+            async with self._session_maker() as session:
+                versions = await load_versions(session)
+                changed = [
+                    category for category in CATEGORIES
+                    if full or versions.get(category, 0) != current.versions.get(category, 0)
+                ]
+                rows: Dict[str, List[Tuple[str, Any, Any]]] = {category: [] for category in changed}
+                if changed:
+                    # Один запрос по ключу (category, name) вместо запроса на категорию
+                    table = Component.__table__
+                    result = await session.execute(
+                        select(table.c.category, table.c.name, table.c.raw_value, table.c.watts)
+                        .where(table.c.category.in_(changed))
+                        .order_by(table.c.category, table.c.name)
+                    )
+                    for category, name, raw_value, watts in result.tuples():
+                        rows[category].append((name, raw_value, watts))
+
+            self._signature = signature
+            if not changed and versions == dict(current.versions):
+                return current
+            rebuilt = await asyncio.to_thread(self._build, rows)
+            self._snapshot = CatalogSnapshot(
+                versions=MappingProxyType(versions),
+                categories=MappingProxyType({**current.categories, **rebuilt}),
+            )
+            logger.info(
+                "Снимок каталога v%s загружен: %s",
+                self._snapshot.version,
+                ", ".join(f"{c}={len(s.rows)}" for c, s in rebuilt.items()) or "без изменений записей",
+            )
+            return self._snapshot
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self._watch_interval)
+            try:
+                if self._file_signature() != self._signature:
+                    logger.info("Файл БД изменился, перезагружаю снимок каталога")
+                    await self.reload(full=True)
+            except Exception as e:
+                logger.warning(f"Ошибка при обновлении снимка каталога: {e}")
+
+    def start_watching(self):
+        if self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def stop_watching(self):
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+
+
+if __name__ == "__main__":
+    # Размер и разбор ответа: восемь списков категорий против GET /catalog. python -m backend.catalog
+    import json
+    import shutil
+    import tempfile
+    import time
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from backend.compression import EncodedBody
+    from backend.database.database import Base, db_path, make_engine
+    from backend.database.migrations import run_migrations
+
+    async def load(path: str) -> CatalogSnapshot:
+        with create_engine(f"sqlite:///{path}").begin() as conn:
+            Base.metadata.create_all(conn)
+            run_migrations(conn)
+        engine = make_engine(path, read_only=True)
+        try:
+            return await CatalogStore(async_sessionmaker(engine), path).reload()
+        finally:
+            await engine.dispose()
+
+    def parse_lists(bodies):
+        # Прежний клиент: список словарей на категорию, из которого берутся названия
+        return {category: [row.get("name") for row in json.loads(body)["data"]] for category, body in bodies.items()}
+
+    def parse_bundle(body):
+        return {category: columns["names"] for category, columns in json.loads(body)["data"].items()}
+
+    def timed(fn, *args, rounds: int = 20) -> float:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            fn(*args)
+        return (time.perf_counter() - started) / rounds
+
+    with tempfile.TemporaryDirectory() as tmp:
+        copy = os.path.join(tmp, "components.db")
+        shutil.copyfile(db_path, copy)
+        snapshot = asyncio.run(load(copy))
+
+    lists = {
+        category: EncodedBody.from_content({"success": True, "data": snapshot[category].rows, "next_after": None})
+        for category in CATEGORIES
+    }
+    bundle = EncodedBody.from_content(snapshot.bundle())
+    assert parse_bundle(bundle.body) == {c: sorted(names) for c, names in parse_lists(
+        {c: b.body for c, b in lists.items()}).items()}
+
+    print(f"{sum(len(s.rows) for s in snapshot.categories.values())} components, catalog v{snapshot.version}")
+    for title, bodies in (("8 lists", list(lists.values())), ("bundle", [bundle])):
+        raw = sum(len(b.body) for b in bodies)
+        gzipped = sum(len(b.variant("gzip")) for b in bodies)
+        print(f"  {title:8s} {raw / 1024:8.1f} KiB, gzip {gzipped / 1024:7.1f} KiB, {len(bodies)} request(s)")
+    print(f"  client parse: lists {timed(parse_lists, {c: b.body for c, b in lists.items()}) * 1e3:.2f} ms, "
+          f"bundle {timed(parse_bundle, bundle.body) * 1e3:.2f} ms")
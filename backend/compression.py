@@ -0,0 +1,108 @@
+"""
+Сжатие крупных ответов каталога.
+
+Тело ответа сериализуется один раз на версию снимка каталога, а его
+gzip/brotli-варианты создаются при первом запросе и переиспользуются,
+пока снимок не сменится. Brotli используется, только если установлен
+пакет brotli.
+"""
+import gzip
+import json
+from typing import Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Ответы меньше этого размера отдаются без сжатия
+MIN_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def _supported_encodings():
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Выбрать кодировку из заголовка Accept-Encoding с учётом q-значений"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in _supported_encodings():
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class EncodedBody:
+    """Сериализованное тело ответа и кэш его сжатых вариантов"""
+
+    def __init__(self, body: bytes, media_type: str = "application/json"):
+        self.body = body
+        self.media_type = media_type
+        self._variants: Dict[str, bytes] = {}
+
+    @classmethod
+    def from_content(cls, content) -> "EncodedBody":
+        # Те же параметры сериализации, что и у fastapi.responses.JSONResponse
+        body = json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        return cls(body)
+
+    def variant(self, encoding: Optional[str]) -> bytes:
+        if encoding is None or len(self.body) < MIN_SIZE:
+            return self.body
+        compressed = self._variants.get(encoding)
+        if compressed is None:
+            compressed = _compress(self.body, encoding)
+            self._variants[encoding] = compressed
+        return compressed
+
+    def response(self, request: Request, headers: Optional[Dict[str, str]] = None) -> Response:
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+        body = self.variant(encoding)
+        response_headers = {"Vary": "Accept-Encoding"}
+        if body is not self.body:
+            response_headers["Content-Encoding"] = encoding
+        if headers:
+            response_headers.update(headers)
+        return Response(content=body, media_type=self.media_type, headers=response_headers)
+
+
+def cached_response(request: Request, cache: Dict, key, build: Callable[[], object],
+                    headers: Optional[Dict[str, str]] = None) -> Response:
+    """Отдать ответ из кэша cache[key], построив и сериализовав его при первом обращении"""
+    encoded = cache.get(key)
+    if encoded is None:
+        encoded = EncodedBody.from_content(build())
+        cache[key] = encoded
+    return encoded.response(request, headers)
@@ -1,7 +1,7 @@
-from .database import engine, Base, new_session, get_session
-
-__all__ = ['engine', 'Base', 'new_session', 'get_session']
-
-
-
-
+from .database import engine, Base, new_session, get_session
+
+__all__ = ['engine', 'Base', 'new_session', 'get_session']
+
+
+
+
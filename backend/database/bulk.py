@@ -0,0 +1,79 @@
+"""
+Пакетная запись комплектующих: INSERT ... ON CONFLICT(category, name)
+DO UPDATE одним executemany в рамках одной транзакции.
+
+Запись идёт прямо в components: UPSERT в представление категории SQLite
+не поддерживает.
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.sqlite import insert
+
+from backend.database.models import Component
+from backend.database.watts import parse_watts
+
+# Ограничение на число параметров в одном IN (...) для старых сборок SQLite
+CHUNK_SIZE = 500
+
+
+def stored_values(value) -> Tuple[Optional[str], Optional[int]]:
+    """raw_value и watts, с которыми значение колонки модели записывается в components"""
+    return None if value is None else str(value), parse_watts(value)
+
+
+def prepare_rows(model, rows: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Строки components для записей модели категории; дубликаты по name убираются (побеждает последний)"""
+    category = model.__tablename__
+    source = model.__value_column__
+    prepared = {}
+    for row in rows:
+        raw_value, watts = stored_values(row.get(source))
+        prepared[row["name"]] = {
+            "category": category,
+            "name": row["name"],
+            "raw_value": raw_value,
+            "watts": watts,
+        }
+    return prepared
+
+
+async def bulk_upsert(session, model, rows: Iterable[Dict[str, Any]], table=None) -> Tuple[int, int]:
+    """
+    Вставить или обновить записи категории модели по ключу (category, name).
+
+    Коммит остаётся за вызывающим кодом. table — таблица со схемой
+    components, в которую идёт запись вместо неё (например, теневая).
+
+    Returns:
+        Количество вставленных и фактически изменённых записей
+    """
+    prepared = prepare_rows(model, rows)
+    if not prepared:
+        return 0, 0
+
+    if table is None:
+        table = Component.__table__
+    category = model.__tablename__
+    names = list(prepared)
+    existing = set()
+    for i in range(0, len(names), CHUNK_SIZE):
+        result = await session.execute(
+            select(table.c.name).where(table.c.category == category, table.c.name.in_(names[i:i + CHUNK_SIZE]))
+        )
+        existing.update(result.scalars().all())
+
+    stmt = insert(table)
+    update_columns = {
+        c: stmt.excluded[c] for c in table.columns.keys() if c not in ("category", "name")
+    }
+    # Совпадающие строки не переписываются и не считаются обновлёнными
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["category", "name"],
+        set_=update_columns,
+        where=or_(*(table.c[c].is_distinct_from(stmt.excluded[c]) for c in update_columns)),
+    )
+    result = await session.execute(stmt, list(prepared.values()))
+
+    inserted = len(prepared) - len(existing)
+    return inserted, result.rowcount - inserted
@@ -1,20 +1,154 @@
-import sys, os
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
-
-def resource_path(rel_path):
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, rel_path)
-    return os.path.join(os.path.abspath("."), rel_path)
-
-db_path = resource_path("backend/components.db")
-
-engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
-new_session = async_sessionmaker(engine, expire_on_commit=False)
-
-class Base(DeclarativeBase):
-    pass
-
-async def get_session():
-    async with new_session() as session:
-        yield session
+import sys, os
+from typing import Any, Mapping
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase
+
+def resource_path(rel_path):
+    if hasattr(sys, "_MEIPASS"):
+        return os.path.join(sys._MEIPASS, rel_path)
+    return os.path.join(os.path.abspath("."), rel_path)
+
+db_path = resource_path("backend/components.db")
+
+# PRAGMA, которые выполняются на каждом новом соединении.
+# WAL: читатели не блокируются записью; synchronous=NORMAL в режиме WAL
+# не теряет целостность, только последние транзакции при сбое питания.
+STORAGE_PROFILE: Mapping[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,  # отрицательное значение — в КиБ, т.е. 64 МиБ
+    "temp_store": "MEMORY",
+}
+
+def apply_profile(dbapi_connection, profile: Mapping[str, Any], read_only: bool = False):
+    cursor = dbapi_connection.cursor()
+    for pragma, value in profile.items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    if read_only:
+        # Соединение только для чтения: любая запись завершится ошибкой
+        cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+def make_engine(path: str, profile: Mapping[str, Any] = STORAGE_PROFILE, read_only: bool = False):
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        apply_profile(dbapi_connection, profile, read_only)
+
+    return async_engine
+
+engine = make_engine(db_path)
+new_session = async_sessionmaker(engine, expire_on_commit=False)
+
+# Отдельный пул для читающих маршрутов
+read_engine = make_engine(db_path, read_only=True)
+new_read_session = async_sessionmaker(read_engine, expire_on_commit=False)
+
+class Base(DeclarativeBase):
+    pass
+
+async def get_session():
+    async with new_session() as session:
+        yield session
+
+async def get_read_session():
+    async with new_read_session() as session:
+        yield session
+
+if __name__ == "__main__":
+    # Бенчмарк профилей хранения: python -m backend.database.database [строк]
+    import asyncio
+    import random
+    import tempfile
+    import time
+    from sqlalchemy import text
+
+    ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    BATCH = 500
+
+    # Схема таблицы components (models.Component и индекс миграции unify_components)
+    def create_sql(without_rowid: bool) -> str:
+        return ("CREATE TABLE components (category VARCHAR NOT NULL, name VARCHAR NOT NULL, raw_value VARCHAR, "
+                "watts INTEGER, PRIMARY KEY (category, name))" + (" WITHOUT ROWID" if without_rowid else ""))
+
+    async def bench(profile, without_rowid: bool):
+        rng = random.Random(21)
+        names = [f"Intel Core i{rng.randint(3, 9)}-{rng.randint(1000, 99999)}K Processor #{i}" for i in range(ROWS)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.db")
+            bench_engine = make_engine(path, profile)
+            sessions = async_sessionmaker(bench_engine)
+            async with bench_engine.begin() as conn:
+                await conn.exec_driver_sql(create_sql(without_rowid))
+                await conn.exec_driver_sql(
+                    "CREATE INDEX ix_components_category_watts ON components (category, watts)"
+                )
+
+            upsert = text("INSERT INTO components VALUES ('cpus', :name, :raw_value, :watts) "
+                          "ON CONFLICT(category, name) "
+                          "DO UPDATE SET raw_value = excluded.raw_value, watts = excluded.watts")
+            # Запись как при обновлении каталога: пачки по BATCH строк, каждая в своей транзакции
+            started = time.perf_counter()
+            for rewrite in range(2):
+                for i in range(0, ROWS, BATCH):
+                    async with sessions() as session:
+                        await session.execute(upsert, [
+                            {"name": n, "raw_value": f"{65 + rewrite + j % 100} W", "watts": 65 + rewrite + j % 100}
+                            for j, n in enumerate(names[i:i + BATCH])
+                        ])
+                        await session.commit()
+            writes = 2 * ROWS / (time.perf_counter() - started)
+
+            lookups = rng.sample(names, min(ROWS, 5000))
+            point = text("SELECT * FROM components WHERE category = 'cpus' AND name = :name")
+            scan = text("SELECT * FROM components WHERE category = 'cpus' ORDER BY name")
+            async with sessions() as session:
+                started = time.perf_counter()
+                for name in lookups:
+                    (await session.execute(point, {"name": name})).first()
+                reads = len(lookups) / (time.perf_counter() - started)
+
+                started = time.perf_counter()
+                for _ in range(20):
+                    (await session.execute(scan)).all()
+                scans = 20 * ROWS / (time.perf_counter() - started)
+            await bench_engine.dispose()
+
+            # Те же запросы напрямую через sqlite3, без накладных расходов aiosqlite
+            import sqlite3
+            raw = sqlite3.connect(path)
+            apply_profile(raw, profile)
+            started = time.perf_counter()
+            for _ in range(4):
+                for name in lookups:
+                    raw.execute("SELECT * FROM components WHERE category = 'cpus' AND name = ?", (name,)).fetchone()
+            raw_reads = 4 * len(lookups) / (time.perf_counter() - started)
+            # Те же запросы к копии файла в памяти (backup API)
+            memory = sqlite3.connect(":memory:")
+            raw.backup(memory)
+            started = time.perf_counter()
+            for _ in range(4):
+                for name in lookups:
+                    memory.execute("SELECT * FROM components WHERE category = 'cpus' AND name = ?", (name,)).fetchone()
+            memory_reads = 4 * len(lookups) / (time.perf_counter() - started)
+            memory.close()
+            raw.close()
+            size = os.path.getsize(path)
+        return writes, reads, raw_reads, memory_reads, scans, size
+
+    async def main():
+        print(f"{ROWS} rows")
+        for title, profile, without_rowid in (
+            ("defaults, rowid", {}, False),
+            ("profile, rowid", STORAGE_PROFILE, False),
+            ("profile, WITHOUT ROWID", STORAGE_PROFILE, True),
+        ):
+            writes, reads, raw_reads, memory_reads, scans, size = await bench(profile, without_rowid)
+            print(f"{title:24s} upsert {writes:7.0f} rows/s | lookup {reads:6.0f} q/s "
+                  f"(sqlite3 {raw_reads:6.0f} q/s, in-memory copy {memory_reads:6.0f} q/s) | "
+                  f"ordered scan {scans:7.0f} rows/s | file {size / 1e6:5.1f} MB")
+
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""
+Полнотекстовый поиск по названиям комплектующих (SQLite FTS5, токенизатор trigram).
+
+Виртуальная таблица components_fts (category, name) синхронизируется
+с components триггерами. Поиск подстроки идёт по триграммному индексу
+вместо полного сканирования через ILIKE '%...%', по всем категориям
+сразу или с фильтром по категории.
+"""
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+
+from backend.database.models import Component
+
+logger = logging.getLogger(__name__)
+
+TABLE = Component.__tablename__
+FTS_TABLE = f"{TABLE}_fts"
+
+# Триграммный индекс не находит подстроки короче трёх символов
+MIN_MATCH_LENGTH = 3
+
+
+def _delete_sql(row: str) -> str:
+    """
+    Удаление записи row из FTS-таблицы внутри триггера.
+
+    Равенство по колонкам FTS-таблица проверяет только полным перебором,
+    поэтому кандидаты сначала ищутся по триграммам названия; названия
+    короче трёх символов триграммами не находятся и удаляются перебором.
+    """
+    match = f"""'name:"' || replace({row}.name, '"', '""') || '"'"""
+    return (
+        f"DELETE FROM {FTS_TABLE} WHERE length({row}.name) >= {MIN_MATCH_LENGTH} "
+        f"AND {FTS_TABLE} MATCH {match} AND category = {row}.category AND name = {row}.name; "
+        f"DELETE FROM {FTS_TABLE} WHERE length({row}.name) < {MIN_MATCH_LENGTH} "
+        f"AND category = {row}.category AND name = {row}.name;"
+    )
+
+
+def create_fts(conn):
+    """Создать FTS-таблицу и триггеры синхронизации, при расхождении перестроить индекс"""
+    conn.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(category UNINDEXED, name, tokenize='trigram')"
+    )
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}(category, name) VALUES (new.category, new.name); END"
+    )
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN {_delete_sql('old')} END"
+    )
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF category, name ON {TABLE} BEGIN "
+        f"{_delete_sql('old')} "
+        f"INSERT INTO {FTS_TABLE}(category, name) VALUES (new.category, new.name); END"
+    )
+
+    indexed = conn.exec_driver_sql(f"SELECT count(*) FROM {FTS_TABLE}").scalar()
+    total = conn.exec_driver_sql(f"SELECT count(*) FROM {TABLE}").scalar()
+    if indexed != total:
+        rebuild_fts(conn)
+        logger.info(f"FTS-индекс {FTS_TABLE} перестроен: {total} записей")
+
+
+def rebuild_fts(conn):
+    """Заполнить FTS-таблицу заново по текущему содержимому components"""
+    conn.exec_driver_sql(f"DELETE FROM {FTS_TABLE}")
+    conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}(category, name) SELECT category, name FROM {TABLE}")
+
+
+async def search_by_name(session, model, query: str, limit: Optional[int] = None):
+    """
+    Поиск записей, в названии которых встречается query (без учёта регистра).
+
+    Сначала точное совпадение, затем совпадение по началу названия,
+    затем по релевантности bm25 и длине названия.
+    """
+    category = model.__tablename__
+    fts = FTS_TABLE
+    if len(query) >= MIN_MATCH_LENGTH:
+        condition = f"{fts} MATCH :match"
+        order = f"{fts}.rank, "
+    else:
+        condition = f"{fts}.name LIKE :pattern"
+        order = ""
+
+    # Представление категории находит запись по ключу (category, name) components
+    sql = (
+        f"SELECT t.* FROM {fts} JOIN {category} AS t ON t.name = {fts}.name "
+        f"WHERE {condition} AND {fts}.category = :category "
+        f"ORDER BY lower({fts}.name) = lower(:query) DESC, "
+        f"{fts}.name LIKE :prefix DESC, {order}length({fts}.name) "
+        f"LIMIT :limit"
+    )
+    result = await session.execute(text(sql), {
+        "query": query,
+        "category": category,
+        "match": '"' + query.replace('"', '""') + '"',
+        "pattern": f"%{query}%",
+        "prefix": f"{query}%",
+        "limit": limit if limit is not None else -1,
+    })
+    return result.mappings().all()
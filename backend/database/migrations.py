@@ -0,0 +1,81 @@
+"""
+Миграции схемы существующего components.db, которые не покрывает create_all
+"""
+import logging
+
+from backend.database.models import Component, CPU, GPU, PSU, RAM, Storage, Cooling, Drive, Motherboard
+from backend.database.fts import create_fts
+from backend.database.watts import parse_watts
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_MODELS = (CPU, GPU, PSU, RAM, Storage, Cooling, Drive, Motherboard)
+
+
+def _object_type(conn, name: str):
+    return conn.exec_driver_sql("SELECT type FROM sqlite_master WHERE name = ?", (name,)).scalar()
+
+
+def _category_ddl(model):
+    """CREATE VIEW и триггеры INSTEAD OF, через которые модель категории пишет в components"""
+    category = model.__tablename__
+    value = model.__value_column__
+    components = Component.__tablename__
+    if "watts" in model.__table__.columns:
+        columns = f"name, raw_value AS {value}, watts"
+        watts = "NEW.watts"
+    else:
+        # consumption таких категорий — целое число ватт
+        columns = f"name, watts AS {value}"
+        watts = f"NEW.{value}"
+    return [
+        f"CREATE VIEW {category} AS SELECT {columns} FROM {components} WHERE category = '{category}'",
+        f"CREATE TRIGGER {category}_insert INSTEAD OF INSERT ON {category} BEGIN "
+        f"INSERT INTO {components} (category, name, raw_value, watts) "
+        f"VALUES ('{category}', NEW.name, NEW.{value}, {watts}); END",
+        # Переименование — отдельным UPDATE, чтобы FTS-триггер срабатывал только на него
+        f"CREATE TRIGGER {category}_update INSTEAD OF UPDATE ON {category} BEGIN "
+        f"UPDATE {components} SET raw_value = NEW.{value}, watts = {watts} "
+        f"WHERE category = '{category}' AND name = OLD.name; "
+        f"UPDATE {components} SET name = NEW.name "
+        f"WHERE category = '{category}' AND name = OLD.name AND NEW.name IS NOT OLD.name; END",
+        f"CREATE TRIGGER {category}_delete INSTEAD OF DELETE ON {category} BEGIN "
+        f"DELETE FROM {components} WHERE category = '{category}' AND name = OLD.name; END",
+    ]
+
+
+def unify_components(conn):
+    """
+    Перенести таблицы категорий в components и заменить их представлениями.
+
+    Мощность пересчитывается из исходной колонки, поэтому перенос не
+    зависит от того, были ли у старой таблицы колонка watts и FTS-индекс.
+    """
+    components = Component.__tablename__
+    conn.exec_driver_sql(
+        f"CREATE INDEX IF NOT EXISTS ix_{components}_category_watts ON {components} (category, watts)"
+    )
+    for model in COMPONENT_MODELS:
+        category = model.__tablename__
+        value = model.__value_column__
+        kind = _object_type(conn, category)
+        if kind == "view":
+            continue
+        if kind == "table":
+            rows = conn.exec_driver_sql(f"SELECT name, {value} FROM {category}").all()
+            if rows:
+                conn.exec_driver_sql(
+                    f"INSERT OR REPLACE INTO {components} (category, name, raw_value, watts) VALUES (?, ?, ?, ?)",
+                    [(category, name, raw, parse_watts(raw)) for name, raw in rows],
+                )
+            # Триггеры старой таблицы удаляются вместе с ней
+            conn.exec_driver_sql(f"DROP TABLE {category}")
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {category}_fts")
+            logger.info(f"Таблица {category} перенесена в {components}: {len(rows)} записей")
+        for statement in _category_ddl(model):
+            conn.exec_driver_sql(statement)
+
+
+def run_migrations(conn):
+    unify_components(conn)
+    create_fts(conn)
@@ -1,46 +1,113 @@
-from sqlalchemy.orm import Mapped, mapped_column
-from backend.database.database import Base
-
-class ComponentBase(Base):
-    __abstract__ = True
-    name: Mapped[str] = mapped_column(primary_key=True)
-
-class CPU(ComponentBase):
-    __tablename__ = "cpus"
-    __table_args__ = {"extend_existing": True}
-    consumption: Mapped[str] = mapped_column()
-
-class GPU(ComponentBase):
-    __tablename__ = "gpus"
-    __table_args__ = {"extend_existing": True}
-    consumption: Mapped[str] = mapped_column()
-
-class PSU(ComponentBase):
-    __tablename__ = "psus"
-    __table_args__ = {"extend_existing": True}
-    wattage: Mapped[str] = mapped_column()
-
-class RAM(ComponentBase):
-    __tablename__ = "ram"
-    __table_args__ = {"extend_existing": True}
-    consumption: Mapped[str] = mapped_column()
-
-class Storage(ComponentBase):
-    __tablename__ = "storages"
-    __table_args__ = {"extend_existing": True}
-    consumption: Mapped[str] = mapped_column()
-
-class Cooling(ComponentBase):
-    __tablename__ = "cooling"
-    __table_args__ = {"extend_existing": True}
-    consumption: Mapped[int] = mapped_column()
-
-class Drive(ComponentBase):
-    __tablename__ = "drives"
-    __table_args__ = {"extend_existing": True}
-    consumption: Mapped[int] = mapped_column()
-
-class Motherboard(ComponentBase):
-    __tablename__ = "motherboards"
-    __table_args__ = {"extend_existing": True}
-    consumption: Mapped[int] = mapped_column()
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Mapped, mapped_column
+from backend.database.database import Base
+from backend.database.watts import parse_watts
+
+class Component(Base):
+    """
+    Все комплектующие в одной таблице с ключом (category, name).
+
+    raw_value — мощность в исходном виде (consumption или wattage
+    категории), watts — её числовое значение. Индекс
+    ix_components_category_watts создаётся миграцией unify_components.
+
+    Таблица WITHOUT ROWID: строки хранятся в B-дереве первичного ключа,
+    поэтому поиск по (category, name) и выборка категории по имени не
+    обращаются к отдельному индексу.
+    """
+    __tablename__ = "components"
+    __table_args__ = {"extend_existing": True, "sqlite_with_rowid": False}
+    category: Mapped[str] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(primary_key=True)
+    raw_value: Mapped[Optional[str]] = mapped_column(nullable=True)
+    watts: Mapped[Optional[int]] = mapped_column(nullable=True)
+
+class ComponentBase(Base):
+    """
+    Комплектующие одной категории.
+
+    Таблица модели — представление над components с триггерами INSTEAD OF
+    (создаются миграцией unify_components), поэтому чтение и вставка через
+    ORM работают как с обычной таблицей. Имя таблицы совпадает с категорией.
+    """
+    __abstract__ = True
+    # Колонка модели, которая хранится в components.raw_value
+    __value_column__ = "consumption"
+    name: Mapped[str] = mapped_column(primary_key=True)
+
+class WattsMixin:
+    """Числовая мощность, вычисляемая из колонки __value_column__ при записи"""
+    watts: Mapped[Optional[int]] = mapped_column(nullable=True)
+
+@event.listens_for(WattsMixin, "before_insert", propagate=True)
+@event.listens_for(WattsMixin, "before_update", propagate=True)
+def _fill_watts(mapper, connection, target):
+    target.watts = parse_watts(getattr(target, target.__value_column__))
+
+class CPU(WattsMixin, ComponentBase):
+    __tablename__ = "cpus"
+    __table_args__ = {"extend_existing": True}
+    consumption: Mapped[str] = mapped_column()
+
+class GPU(WattsMixin, ComponentBase):
+    __tablename__ = "gpus"
+    __table_args__ = {"extend_existing": True}
+    consumption: Mapped[str] = mapped_column()
+
+class PSU(WattsMixin, ComponentBase):
+    __tablename__ = "psus"
+    __table_args__ = {"extend_existing": True}
+    __value_column__ = "wattage"
+    wattage: Mapped[str] = mapped_column()
+
+class RAM(WattsMixin, ComponentBase):
+    __tablename__ = "ram"
+    __table_args__ = {"extend_existing": True}
+    consumption: Mapped[str] = mapped_column()
+
+class Storage(WattsMixin, ComponentBase):
+    __tablename__ = "storages"
+    __table_args__ = {"extend_existing": True}
+    consumption: Mapped[str] = mapped_column()
+
+class Cooling(ComponentBase):
+    __tablename__ = "cooling"
+    __table_args__ = {"extend_existing": True}
+    consumption: Mapped[int] = mapped_column()
+
+class Drive(ComponentBase):
+    __tablename__ = "drives"
+    __table_args__ = {"extend_existing": True}
+    consumption: Mapped[int] = mapped_column()
+
+class Motherboard(ComponentBase):
+    __tablename__ = "motherboards"
+    __table_args__ = {"extend_existing": True}
+    consumption: Mapped[int] = mapped_column()
+
+class CatalogVersion(Base):
+    """Монотонно растущая версия каталога по категориям; category = "*" — глобальная версия"""
+    __tablename__ = "catalog_versions"
+    __table_args__ = {"extend_existing": True}
+    category: Mapped[str] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(default=0)
+
+class RefreshPage(Base):
+    """Состояние страницы источника после последнего обновления каталога"""
+    __tablename__ = "refresh_pages"
+    __table_args__ = {"extend_existing": True}
+    source: Mapped[str] = mapped_column(primary_key=True)
+    page: Mapped[str] = mapped_column(primary_key=True)
+    content_hash: Mapped[str] = mapped_column()
+    row_count: Mapped[int] = mapped_column()
+    last_seen: Mapped[float] = mapped_column()
+
+class RefreshRow(Base):
+    """Хэш значений записи источника и страница, на которой она была получена"""
+    __tablename__ = "refresh_rows"
+    __table_args__ = {"extend_existing": True}
+    source: Mapped[str] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(primary_key=True)
+    page: Mapped[str] = mapped_column()
+    row_hash: Mapped[str] = mapped_column()
@@ -0,0 +1,211 @@
+"""
+Инкрементальное обновление каталога.
+
+Для каждой страницы источника хранятся хэш содержимого, число строк
+и время последнего получения (refresh_pages), для каждой записи —
+хэш значений, с которыми она записана в components, и страница, с
+которой она получена (refresh_rows). Страница с прежним хэшем
+пропускается целиком, в остальных записи сравниваются по хэшу, и в
+таблицу категории пишутся только добавленные и изменённые.
+
+Сохранённое состояние источника проверяется по components: если
+запись источника удалена или изменена в обход обновления (через API,
+/setup_database), состояние источника отбрасывается, и его страницы
+сравниваются заново, как при первом обновлении. Записи, пропавшие со страниц, полученных
+в этом обновлении, удаляются; записи страниц, которые не удалось
+получить, сохраняются, пока страница не пропадает дольше
+PAGE_EXPIRY_HOURS.
+"""
+import hashlib
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Set, Tuple
+
+from sqlalchemy import text
+
+from backend.database.bulk import stored_values
+from backend.database.models import Component
+
+logger = logging.getLogger(__name__)
+
+PAGE_EXPIRY_HOURS = 72
+
+_UPSERT_PAGE = text(
+    "INSERT INTO refresh_pages (source, page, content_hash, row_count, last_seen) "
+    "VALUES (:source, :page, :content_hash, :row_count, :last_seen) "
+    "ON CONFLICT(source, page) DO UPDATE SET content_hash = excluded.content_hash, "
+    "row_count = excluded.row_count, last_seen = excluded.last_seen"
+)
+_DELETE_PAGE = text("DELETE FROM refresh_pages WHERE source = :source AND page = :page")
+_UPSERT_ROW = text(
+    "INSERT INTO refresh_rows (source, name, page, row_hash) VALUES (:source, :name, :page, :row_hash) "
+    "ON CONFLICT(source, name) DO UPDATE SET page = excluded.page, row_hash = excluded.row_hash"
+)
+_DELETE_ROW = text("DELETE FROM refresh_rows WHERE source = :source AND name = :name")
+
+
+async def clear_state(session, sources: Iterable[str]):
+    """Забыть состояние обновления источников (после очистки их категорий); коммит — за вызывающим кодом"""
+    params = [{"source": source} for source in sources]
+    if params:
+        await session.execute(text("DELETE FROM refresh_pages WHERE source = :source"), params)
+        await session.execute(text("DELETE FROM refresh_rows WHERE source = :source"), params)
+
+
+def _digest(value: Any) -> str:
+    data = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class RefreshState:
+    """
+    Состояние обновления источников в памяти на время одного обновления.
+
+    load() читает сохранённое состояние, diff_page() сравнивает с ним
+    очередную страницу, save() записывает новое состояние и удаляет
+    пропавшие записи в транзакции вызывающего кода.
+    """
+
+    def __init__(self, models: Mapping[str, Any], pages: Mapping[Tuple[str, str], Tuple[str, float]],
+                 rows: Mapping[str, Dict[str, Tuple[str, str]]]):
+        self.started = time.time()
+        # source -> колонка значения модели категории
+        self._value_columns = {source: model.__value_column__ for source, model in models.items()}
+        # (source, page) -> (content_hash, last_seen)
+        self._pages = dict(pages)
+        # source -> name -> (row_hash, page)
+        self._rows: Dict[str, Dict[str, Tuple[str, str]]] = defaultdict(dict, rows)
+        self._received: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        self._row_updates: Dict[str, Dict[str, Tuple[str, str]]] = defaultdict(dict)
+        self._seen: Dict[str, Set[str]] = defaultdict(set)
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+        )
+
+    @classmethod
+    async def load(cls, session, models: Mapping[str, Any]) -> "RefreshState":
+        """
+        Прочитать сохранённое состояние источников.
+
+        Args:
+            models: источник (категория) -> модель категории
+        """
+        params = {f"s{i}": source for i, source in enumerate(models)}
+        placeholders = ", ".join(f":{key}" for key in params)
+        pages = await session.execute(text(
+            f"SELECT source, page, content_hash, last_seen FROM refresh_pages WHERE source IN ({placeholders})"
+        ), params)
+        rows = await session.execute(text(
+            f"SELECT source, name, row_hash, page FROM refresh_rows WHERE source IN ({placeholders})"
+        ), params)
+        known: Dict[str, Dict[str, Tuple[str, str]]] = defaultdict(dict)
+        for source, name, row_hash, page in rows:
+            known[source][name] = (row_hash, page)
+        pages = {(source, page): (digest, seen) for source, page, digest, seen in pages}
+
+        stored = await session.execute(text(
+            f"SELECT category, name, raw_value, watts FROM {Component.__tablename__} "
+            f"WHERE category IN ({placeholders})"
+        ), params)
+        actual: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for category, name, raw_value, watts in stored:
+            actual[category][name] = _digest([raw_value, watts])
+        for source in list(known):
+            if any(actual[source].get(name) != row_hash for name, (row_hash, _) in known[source].items()):
+                logger.info(f"Состояние обновления {source} не совпадает с {Component.__tablename__}, "
+                            f"источник будет сравнён заново")
+                del known[source]
+                pages = {key: value for key, value in pages.items() if key[0] != source}
+        return cls(models, pages, known)
+
+    def diff_page(self, source: str, page: str, rows: Mapping[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Сравнить страницу с прошлым обновлением.
+
+        Args:
+            rows: name -> значения колонок записи
+
+        Пустая страница считается не полученной: её прежние записи не удаляются.
+
+        Returns:
+            Добавленные и изменённые записи страницы
+        """
+        if not rows:
+            return []
+        digest = _digest([rows[name] for name in sorted(rows)])
+        self._received[(source, page)] = (digest, len(rows))
+        self._seen[source].update(rows)
+        stats = self.stats[source]
+
+        previous = self._pages.get((source, page))
+        if previous is not None and previous[0] == digest:
+            stats["unchanged"] += len(rows)
+            return []
+
+        known = self._rows[source]
+        updates = self._row_updates[source]
+        value_column = self._value_columns[source]
+        changed = []
+        for name, values in rows.items():
+            row_hash = _digest(list(stored_values(values.get(value_column))))
+            old = known.get(name)
+            if old is None:
+                stats["added"] += 1
+                changed.append(values)
+            elif old[0] != row_hash:
+                stats["changed"] += 1
+                changed.append(values)
+            else:
+                stats["unchanged"] += 1
+            if old != (row_hash, page):
+                updates[name] = (row_hash, page)
+        return changed
+
+    def removed(self, source: str) -> List[str]:
+        """Записи, которых больше нет на полученных или давно пропавших страницах источника"""
+        expired_before = self.started - PAGE_EXPIRY_HOURS * 3600
+        pages = {page for (s, page) in self._received if s == source}
+        pages |= {page for (s, page), (_, last_seen) in self._pages.items()
+                  if s == source and page not in pages and last_seen < expired_before}
+        seen = self._seen[source]
+        return [name for name, (_, page) in self._rows[source].items()
+                if name not in seen and page in pages]
+
+    async def save(self, session, source: str, table: str, category: str) -> List[str]:
+        """
+        Записать состояние источника и удалить из table пропавшие записи категории.
+
+        Коммит остаётся за вызывающим кодом.
+
+        Returns:
+            Имена удалённых записей
+        """
+        removed = self.removed(source)
+        if removed:
+            await session.execute(text(f"DELETE FROM {table} WHERE category = :category AND name = :name"),
+                                  [{"category": category, "name": name} for name in removed])
+            await session.execute(_DELETE_ROW, [{"source": source, "name": name} for name in removed])
+            self.stats[source]["removed"] += len(removed)
+
+        updates = self._row_updates.pop(source, {})
+        if updates:
+            await session.execute(_UPSERT_ROW, [
+                {"source": source, "name": name, "page": page, "row_hash": row_hash}
+                for name, (row_hash, page) in updates.items()
+            ])
+
+        received = [(page, value) for (s, page), value in self._received.items() if s == source]
+        if received:
+            await session.execute(_UPSERT_PAGE, [
+                {"source": source, "page": page, "content_hash": digest,
+                 "row_count": count, "last_seen": self.started}
+                for page, (digest, count) in received
+            ])
+        expired_before = self.started - PAGE_EXPIRY_HOURS * 3600
+        expired = [{"source": source, "page": page} for (s, page), (_, last_seen) in self._pages.items()
+                   if s == source and (s, page) not in self._received and last_seen < expired_before]
+        if expired:
+            await session.execute(_DELETE_PAGE, expired)
+        return removed
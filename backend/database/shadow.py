@@ -0,0 +1,75 @@
+"""
+Теневые копии для обновления каталога без видимых промежуточных состояний.
+
+create_shadow копирует записи обновляемых категорий таблицы в
+<table>__shadow с той же схемой, обновление пишет только в копию, а
+swap_shadow в одной транзакции приводит записи этих категорий в живой
+таблице к записям копии. До коммита читатели видят старые записи
+категорий целиком, после — новые целиком. Таблица и представления
+категорий над ней не пересоздаются, FTS-индекс обновляют её триггеры,
+а записи остальных категорий, сделанные во время обновления, не теряются.
+"""
+import re
+from typing import Iterable, Tuple
+
+from sqlalchemy import MetaData, Table
+
+SHADOW_SUFFIX = "__shadow"
+
+_CREATE_TABLE = re.compile(r'^\s*CREATE\s+TABLE\s+("?)(\w+)\1', re.IGNORECASE)
+
+
+def shadow_name(table: str) -> str:
+    return f"{table}{SHADOW_SUFFIX}"
+
+
+def shadow_table(model) -> Table:
+    """Таблица SQLAlchemy для теневой копии таблицы модели (для bulk_upsert)"""
+    return model.__table__.to_metadata(MetaData(), name=shadow_name(model.__tablename__))
+
+
+def _categories(categories: Iterable[str]) -> Tuple[str, Tuple[str, ...]]:
+    values = tuple(categories)
+    return ", ".join("?" for _ in values), values
+
+
+def create_shadow(conn, table: str, categories: Iterable[str]):
+    """Создать (или пересоздать) теневую копию таблицы с записями категорий"""
+    shadow = shadow_name(table)
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {shadow}")
+    create_sql = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).scalar()
+    conn.exec_driver_sql(_CREATE_TABLE.sub(f'CREATE TABLE "{shadow}"', create_sql, count=1))
+    placeholders, values = _categories(categories)
+    conn.exec_driver_sql(f"INSERT INTO {shadow} SELECT * FROM {table} WHERE category IN ({placeholders})", values)
+
+
+def drop_shadow(conn, table: str):
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {shadow_name(table)}")
+
+
+def swap_shadow(conn, table: str, categories: Iterable[str]):
+    """
+    Заменить записи категорий в таблице записями теневой копии и удалить копию.
+
+    Меняются только отличающиеся записи, чтобы триггеры таблицы (FTS)
+    срабатывали на изменения, а не на всю категорию. Должно выполняться
+    в транзакции вызывающего кода вместе с остальными изменениями, которые
+    должны стать видны одновременно.
+    """
+    placeholders, values = _categories(categories)
+    if values:
+        shadow = shadow_name(table)
+        conn.exec_driver_sql(
+            f"DELETE FROM {table} WHERE category IN ({placeholders}) AND NOT EXISTS "
+            f"(SELECT 1 FROM {shadow} AS s WHERE s.category = {table}.category AND s.name = {table}.name)",
+            values,
+        )
+        conn.exec_driver_sql(
+            f"INSERT INTO {table} SELECT * FROM {shadow} WHERE category IN ({placeholders}) "
+            f"ON CONFLICT(category, name) DO UPDATE SET raw_value = excluded.raw_value, watts = excluded.watts "
+            f"WHERE raw_value IS NOT excluded.raw_value OR watts IS NOT excluded.watts",
+            values,
+        )
+    drop_shadow(conn, table)
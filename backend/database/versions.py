@@ -0,0 +1,34 @@
+"""
+Версии каталога: счётчики в таблице catalog_versions, которые
+увеличиваются при каждой записи в категорию. Глобальная версия ("*")
+увеличивается вместе с любой категорией.
+"""
+from typing import Dict, Iterable
+
+from sqlalchemy import text
+
+GLOBAL = "*"
+
+_BUMP = text(
+    "INSERT INTO catalog_versions (category, version) VALUES (:category, 1) "
+    "ON CONFLICT(category) DO UPDATE SET version = version + 1"
+)
+
+
+async def bump_versions(session, categories: Iterable[str]):
+    """
+    Увеличить версии категорий и глобальную версию.
+
+    Выполняется в транзакции вызывающего кода (AsyncSession или AsyncConnection),
+    чтобы версия менялась атомарно вместе с данными.
+    """
+    params = [{"category": c} for c in dict.fromkeys(categories)]
+    if not params:
+        return
+    params.append({"category": GLOBAL})
+    await session.execute(_BUMP, params)
+
+
+async def load_versions(session) -> Dict[str, int]:
+    result = await session.execute(text("SELECT category, version FROM catalog_versions"))
+    return dict(result.all())
@@ -0,0 +1,14 @@
+import re
+from typing import Optional
+
+_WATT_RE = re.compile(r"(\d+)")
+
+
+def parse_watts(value) -> Optional[int]:
+    """Число ватт из строк вида "500 W", "12.5 W", "750"; None, если мощность неизвестна ("—", "−")"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    m = _WATT_RE.search(str(value))
+    return int(m.group(1)) if m else None
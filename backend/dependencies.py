@@ -1,6 +1,78 @@
-from typing import Annotated
-from fastapi import Depends
-from database.database import get_session
-from sqlalchemy.ext.asyncio import AsyncSession
-
-SessionDep = Annotated[AsyncSession, Depends(get_session)]
+from typing import Annotated, Optional
+from fastapi import Depends, HTTPException, Query, Request, Response
+from database.database import get_session, get_read_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.catalog import CatalogStore
+from backend.refresh import RefreshManager
+
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
+# Сессия на соединении с PRAGMA query_only для читающих маршрутов:
+# поиск /{name} по components_fts идёт через неё
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+
+
+def get_catalog(request: Request) -> CatalogStore:
+    return request.app.state.catalog
+
+CatalogDep = Annotated[CatalogStore, Depends(get_catalog)]
+
+
+def get_refresh(request: Request) -> RefreshManager:
+    return request.app.state.refresh
+
+RefreshDep = Annotated[RefreshManager, Depends(get_refresh)]
+
+
+def ensure_not_refreshing(refresh: RefreshManager, category: str):
+    """
+    409, если идёт обновление категории из источников: подмена её записей
+    записями теневой копии затёрла бы запись через API.
+
+    Вызывается после выполнения записи и до коммита: обновление, начатое
+    позже, создаёт теневую копию только после этого коммита.
+    """
+    if refresh.refreshing(category):
+        raise HTTPException(status_code=409, detail=f"Catalog refresh of {category} is in progress")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match сравнивается слабо: префикс W/ не учитывается
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def catalog_etag(category: Optional[str] = None):
+    """
+    Зависимость для читающих маршрутов: ставит ETag версии каталога и
+    отвечает 304 Not Modified по If-None-Match без обращения к БД.
+    """
+    def dependency(request: Request, response: Response, catalog: CatalogDep) -> str:
+        etag = catalog.snapshot.etag(category)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return etag
+    return dependency
+
+
+class ListParams:
+    """Параметры списковых маршрутов: keyset-пагинация по name и выбор колонок"""
+
+    def __init__(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = Query(None, ge=1),
+        fields: Optional[str] = Query(None, description="Колонки через запятую, например name,consumption"),
+    ):
+        self.after = after
+        self.limit = limit
+        self.fields = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+
+    @property
+    def is_full(self) -> bool:
+        return self.after is None and self.limit is None and not self.fields
+
+ListParamsDep = Annotated[ListParams, Depends()]
@@ -1,47 +1,70 @@
-import logging
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
-
-from routers import cpus, gpus, system, ram, storages, cooling, psus, drives, motherboards
-from database.database import engine, Base
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    logger.info("Запуск приложения...")
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        logger.info("База данных инициализирована")
-
-    yield
-    logger.info("Завершение работы приложения...")
-
-app = FastAPI(
-    title="PC Components API",
-    version="1.0.0",
-    lifespan=lifespan
-)
-
-app.include_router(system.router)
-app.include_router(cpus.router)
-app.include_router(gpus.router)
-app.include_router(psus.router)
-app.include_router(ram.router)
-app.include_router(storages.router)
-app.include_router(cooling.router)
-app.include_router(drives.router)
-app.include_router(motherboards.router)
-
-@app.get("/")
-async def root():
-    return {
-        "message": "PC Components API",
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+
+from routers import cpus, gpus, system, ram, storages, cooling, psus, drives, motherboards, calculate, refresh, search, catalog
+from backend.database.database import engine, Base, new_session, new_read_session, db_path
+from backend.database.migrations import run_migrations
+from backend.catalog import CatalogStore
+from backend.compression import MIN_SIZE
+from backend.refresh import AUTO_REFRESH, RefreshManager
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Запуск приложения...")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations)
+        logger.info("База данных инициализирована")
+
+    app.state.catalog = CatalogStore(new_read_session, db_path)
+    await app.state.catalog.reload()
+    app.state.catalog.start_watching()
+
+    # Обновление каталога из источников в фоне: через POST /refresh и, если включено, по расписанию
+    app.state.refresh = RefreshManager(new_session, app.state.catalog)
+    if AUTO_REFRESH:
+        app.state.refresh.start_schedule()
+
+    yield
+    await app.state.refresh.stop()
+    await app.state.catalog.stop_watching()
+    logger.info("Завершение работы приложения...")
+
+app = FastAPI(
+    title="PC Components API",
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+app.add_middleware(GZipMiddleware, minimum_size=MIN_SIZE)
+
+app.include_router(system.router)
+app.include_router(cpus.router)
+app.include_router(gpus.router)
+app.include_router(psus.router)
+app.include_router(ram.router)
+app.include_router(storages.router)
+app.include_router(cooling.router)
+app.include_router(drives.router)
+app.include_router(motherboards.router)
+app.include_router(calculate.router)
+app.include_router(refresh.router)
+app.include_router(search.router)
+app.include_router(catalog.router)
+
+@app.get("/")
+async def root():
+    return {
+        "message": "PC Components API",
+        "docs": "/docs",
+        "redoc": "/redoc"
+    }
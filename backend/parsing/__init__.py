@@ -1,7 +1,7 @@
-from .parser import parse_and_load_data
-
-__all__ = ['parse_and_load_data']
-
-
-
-
+from .parser import REFRESH_CATEGORIES, parse_and_load_data
+
+__all__ = ['REFRESH_CATEGORIES', 'parse_and_load_data']
+
+
+
+
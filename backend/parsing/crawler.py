@@ -0,0 +1,304 @@
+"""
+Общий асинхронный загрузчик страниц для парсеров CPU и GPU.
+
+Все запросы идут через один пул соединений aiohttp в одном потоке:
+число одновременных соединений ограничено глобально и для каждого хоста,
+временные ошибки (таймауты, 429, 5xx) повторяются с экспоненциальной
+задержкой и случайным разбросом, на весь обход задаётся общий таймаут.
+"""
+import asyncio
+import logging
+import random
+import re
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, TypeVar
+
+import aiohttp
+
+from .http_cache import HttpCache, body_hash
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Соединений в полёте на все хосты и на один хост
+MAX_CONCURRENCY = 256
+PER_HOST_LIMIT = 32
+REQUEST_TIMEOUT = 15.0
+# Общий таймаут на полный обход всех источников
+CRAWL_TIMEOUT = 600.0
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+MAX_BACKOFF = 10.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Обход страниц: сколько страниц запрашивать наперёд, если их число неизвестно,
+# после скольких подряд пустых или повторных страниц остановиться
+PAGE_WINDOW = 16
+EMPTY_PAGES_LIMIT = 3
+MAX_PAGES = 1000
+# Сколько страниц одного источника одновременно запрошено или ждёт обработки
+PAGES_IN_FLIGHT = 64
+
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/json,application/xhtml+xml,*/*;q=0.9",
+    "Accept-Language": "en-US,en;q=0.9",
+    "X-Requested-With": "XMLHttpRequest",
+}
+
+
+class Crawler:
+    """
+    Загрузчик страниц с общим пулом соединений.
+
+    Используется как асинхронный контекстный менеджер. Лимиты соединений
+    задаются коннектором aiohttp, очередь ожидающих запросов общая.
+    Если указан cache_path, get_parsed хранит результаты в HttpCache.
+    """
+
+    def __init__(self, headers: Optional[Mapping[str, str]] = None,
+                 concurrency: int = MAX_CONCURRENCY, per_host: int = PER_HOST_LIMIT,
+                 timeout: float = REQUEST_TIMEOUT, retries: int = MAX_RETRIES,
+                 backoff: float = BACKOFF_FACTOR, cache_path=None):
+        self._headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._concurrency = concurrency
+        self._per_host = per_host
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._cache_path = cache_path
+        self._cache: Optional[HttpCache] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "Crawler":
+        self._session = aiohttp.ClientSession(
+            headers=self._headers,
+            connector=aiohttp.TCPConnector(limit=self._concurrency, limit_per_host=self._per_host),
+            # Таймаут считается с момента получения соединения, а не постановки в очередь
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=self._timeout, sock_read=self._timeout),
+        )
+        if self._cache_path is not None:
+            self._cache = HttpCache(self._cache_path)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+        self._session = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def _delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        # Full jitter: случайная задержка до backoff * 2^attempt
+        delay = random.uniform(0, min(MAX_BACKOFF, self._backoff * (2 ** attempt)))
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(MAX_BACKOFF, float(retry_after)))
+        return delay
+
+    async def _request(self, url: str, params: Optional[Mapping],
+                       headers: Optional[Mapping[str, str]]) -> Optional[Tuple[int, Mapping[str, str], str]]:
+        for attempt in range(self._retries + 1):
+            retry_after = None
+            try:
+                async with self._session.get(url, params=params, headers=headers) as response:
+                    if response.status not in RETRY_STATUSES:
+                        if response.status >= 400:
+                            logger.warning(f"Failed to fetch {response.url}: HTTP {response.status}")
+                            return None
+                        return response.status, response.headers, await response.text()
+                    error = f"HTTP {response.status}"
+                    retry_after = response.headers.get("Retry-After")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = f"{type(e).__name__}: {e}"
+
+            if attempt < self._retries:
+                await asyncio.sleep(self._delay(attempt, retry_after))
+
+        logger.warning(f"Failed to fetch {url} {dict(params or {})} after {self._retries + 1} attempts: {error}")
+        return None
+
+    async def get(self, url: str, params: Optional[Mapping] = None,
+                  headers: Optional[Mapping[str, str]] = None) -> Optional[str]:
+        """
+        Текст страницы или None, если она так и не была получена.
+
+        Ошибки не пробрасываются: как и раньше, недоступная страница
+        просто не даёт строк.
+        """
+        result = await self._request(url, params, headers)
+        return result[2] if result is not None else None
+
+    async def get_parsed(self, url: str, parse: Callable[[str], Any], params: Optional[Mapping] = None,
+                         headers: Optional[Mapping[str, str]] = None, tag: Optional[str] = None) -> Any:
+        """
+        parse(текст страницы) или None, если страница не была получена.
+
+        С кэшем запрос условный: при 304 или неизменном теле parse не
+        вызывается. tag отличает разные парсеры одного URL (по умолчанию
+        имя функции parse), результат parse должен сериализоваться в JSON.
+        parse выполняется в пуле потоков, чтобы не блокировать цикл событий.
+        """
+        loop = asyncio.get_running_loop()
+        if self._cache is None:
+            text = await self.get(url, params, headers)
+            return await loop.run_in_executor(None, parse, text) if text is not None else None
+
+        key = self._cache.key(url, params, tag or f"{parse.__module__}.{parse.__qualname__}")
+        cached = self._cache.get(key)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        result = await self._request(url, params, request_headers)
+        if result is None:
+            return None
+        status, response_headers, text = result
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+
+        if cached is not None and status == 304:
+            self._cache.revalidated(key, etag, last_modified)
+            return cached.value
+        digest = body_hash(text)
+        if cached is not None and cached.body_hash == digest:
+            self._cache.revalidated(key, etag, last_modified)
+            return cached.value
+
+        value = await loop.run_in_executor(None, parse, text)
+        self._cache.put(key, etag, last_modified, digest, value)
+        return value
+
+
+def discover_last_page(html: str, param: str) -> Optional[int]:
+    """Номер последней страницы по ссылкам пагинации вида ?param=N или &param=N"""
+    pages = [int(n) for n in re.findall(rf"[?&;]{re.escape(param)}=(\d+)", html)]
+    return max(pages) if pages else None
+
+
+async def crawl_pages(fetch: Callable[[int], Awaitable[Optional[List[T]]]],
+                      key: Callable[[T], Hashable],
+                      start_page: int,
+                      last_page: Optional[int] = None,
+                      seen_rows: Iterable[T] = (),
+                      window: int = PAGE_WINDOW,
+                      stop_after: int = EMPTY_PAGES_LIMIT,
+                      sink: Optional[Callable[[int, List[T]], Awaitable[None]]] = None) -> List[T]:
+    """
+    Строки со страниц start_page, start_page + 1, ... в порядке страниц.
+
+    Если задан sink, номер и строки каждой страницы передаются в
+    sink(page, rows) по мере обработки и не накапливаются (возвращается
+    пустой список).
+
+    fetch(page) возвращает строки страницы или None, если её не удалось
+    загрузить. Если число страниц last_page известно, все они
+    запрашиваются сразу, а за ним проверяется одна страница: если она
+    не пустая, источник вырос, и обход продолжается окном по window
+    страниц. Обход останавливается после stop_after подряд пустых,
+    неудачных или целиком повторных страниц (ключи строк уже встречались),
+    ещё не выполненные запросы при этом отменяются. Одновременно
+    запрошено не больше PAGES_IN_FLIGHT страниц.
+    """
+    window = max(window, stop_after)
+    seen = {key(row) for row in seen_rows}
+    tasks: Dict[int, asyncio.Task] = {}
+    pages: List[List[T]] = []
+    next_page = cursor = start_page
+    last_good = start_page - 1
+    empty_run = 0
+
+    def frontier() -> int:
+        if last_page is not None and last_good <= last_page:
+            return max(last_page, last_good) + 1
+        return last_good + window
+
+    try:
+        while True:
+            limit = min(frontier(), cursor + PAGES_IN_FLIGHT - 1, start_page + MAX_PAGES - 1)
+            while next_page <= limit:
+                tasks[next_page] = asyncio.ensure_future(fetch(next_page))
+                next_page += 1
+            if cursor not in tasks:
+                break
+
+            # Страницы оцениваются строго по порядку, чтобы «подряд» означало соседние номера
+            rows = await tasks.pop(cursor)
+            keys = {key(row) for row in rows or ()}
+            if keys - seen:
+                seen |= keys
+                if sink is not None:
+                    await sink(cursor, rows)
+                else:
+                    pages.append(rows)
+                last_good = cursor
+                empty_run = 0
+            else:
+                empty_run += 1
+                if empty_run >= stop_after:
+                    logger.info(f"Pagination stopped at page {cursor}: {empty_run} empty or duplicate pages in a row")
+                    break
+            cursor += 1
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    return [row for page in pages for row in page]
+
+
+def run(job: Callable[[Crawler], Awaitable[T]], timeout: float = CRAWL_TIMEOUT, **options) -> T:
+    """Выполнить job(crawler) в новом цикле событий из синхронного кода"""
+    async def main():
+        async with Crawler(**options) as crawler:
+            return await asyncio.wait_for(job(crawler), timeout)
+
+    return asyncio.run(main())
+
+
+if __name__ == "__main__":
+    # Проверка на локальном сервере-заглушке: python -m backend.parsing.crawler
+    import time
+
+    PAGES = 2000
+    LATENCY = 0.05
+    in_flight = peak = 0
+    seen = {}
+
+    async def handle(reader, writer):
+        global in_flight, peak
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                target = request.split(b" ", 2)[1].decode()
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(LATENCY)
+                in_flight -= 1
+                # Каждая десятая страница сначала отвечает 503, чтобы проверить повторы
+                attempts = seen[target] = seen.get(target, 0) + 1
+                status, body = ("503 Service Unavailable", b"busy") \
+                    if target.endswith("0") and attempts == 1 else ("200 OK", target.encode())
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def check():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        port = server.sockets[0].getsockname()[1]
+        url = f"http://127.0.0.1:{port}/page"
+        async with server, Crawler(per_host=MAX_CONCURRENCY, backoff=0.05) as crawler:
+            started = time.perf_counter()
+            pages = await asyncio.gather(*(crawler.get(url, params={"n": n}) for n in range(PAGES)))
+            elapsed = time.perf_counter() - started
+
+        ok = sum(1 for n, page in enumerate(pages) if page == f"/page?n={n}")
+        print(f"{ok}/{PAGES} pages in {elapsed:.2f}s, peak in flight: {peak} "
+              f"(limit {MAX_CONCURRENCY}), sequential estimate: {PAGES * LATENCY:.0f}s")
+
+    asyncio.run(check())
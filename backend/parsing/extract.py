@@ -0,0 +1,242 @@
+"""
+Векторное извлечение названий и мощности из таблиц парсеров.
+
+Колонки DataFrame обрабатываются целиком через Series.str с заранее
+скомпилированными регулярными выражениями вместо iterrows и re.search
+на каждую ячейку. Для PSU итоговая мощность в диапазоне
+MIN_PSU_WATTAGE–MAX_PSU_WATTAGE вычисляется сразу числовой колонкой.
+"""
+import re
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+MIN_PSU_WATTAGE = 300
+MAX_PSU_WATTAGE = 2000
+
+# Мощность в ячейке таблицы PSU: "750 W", иначе число 100–9999, иначе 60–99
+CELL_WATTAGE_PATTERNS = (
+    re.compile(r"(\d{2,5})\s*[Ww]\b"),
+    re.compile(r"\b([1-9]\d{2,3})\b"),
+    re.compile(r"\b([6-9]\d)\b"),
+)
+# Мощность БП по порядку: первое число consumption, "750W" в названии,
+# номер модели ("RM850x", "-750G"), отдельное 3–4-значное число
+CONSUMPTION_NUMBER = re.compile(r"(\d+)")
+NAME_WATTS = re.compile(r"(\d+)\s*[Ww]")
+MODEL_NUMBER_PATTERNS = (
+    re.compile(r"[-_](\d{3,4})[A-Z]"),
+    re.compile(r"[A-Z](\d{3,4})[A-Z]"),
+)
+BARE_NUMBER = re.compile(r"\b(\d{3,4})\b")
+
+
+def clean(series: pd.Series) -> pd.Series:
+    """str(value).strip() для каждой ячейки, '' для пустых"""
+    return series.astype(str).str.strip().where(series.notna(), "")
+
+
+def _valid(text: pd.Series) -> pd.Series:
+    return text.ne("") & text.str.lower().ne("nan")
+
+
+def name_and_consumption(df: pd.DataFrame, name_col, power_col) -> pd.DataFrame:
+    """Колонки name и consumption без строк, где одно из значений пустое или 'nan'"""
+    name = clean(df[name_col])
+    consumption = clean(df[power_col]) if power_col is not None else pd.Series("", index=df.index)
+    valid = _valid(name) & _valid(consumption)
+    return pd.DataFrame({"name": name[valid], "consumption": consumption[valid]})
+
+
+def joined_name(df: pd.DataFrame, columns: Iterable) -> pd.Series:
+    """Значения колонок через пробел, пустые и 'nan' пропускаются"""
+    name = pd.Series("", index=df.index)
+    for col in columns:
+        if col is None:
+            continue
+        part = clean(df[col])
+        name = name.str.cat(part.where(_valid(part), ""), sep=" ")
+    return name.str.strip()
+
+
+def _first_match(text: pd.Series, patterns) -> pd.Series:
+    result = text.str.extract(patterns[0], expand=False)
+    for pattern in patterns[1:]:
+        missing = result.isna()
+        if not missing.any():
+            break
+        result[missing] = text[missing].str.extract(pattern, expand=False)
+    return result
+
+
+def cell_wattage(df: pd.DataFrame, columns: Iterable) -> pd.Series:
+    """
+    Текст мощности из первой по порядку колонки, где он нашёлся.
+
+    В каждой ячейке шаблоны CELL_WATTAGE_PATTERNS пробуются по очереди,
+    следующая колонка просматривается только для строк без результата.
+    """
+    result = pd.Series(np.nan, index=df.index, dtype=object)
+    for col in columns:
+        missing = result.isna() & df[col].notna()
+        if not missing.any():
+            continue
+        text = df.loc[missing, col].astype(str)
+        result[missing] = _first_match(text, CELL_WATTAGE_PATTERNS)
+    return result
+
+
+def _in_range(values) -> pd.Series:
+    numbers = pd.to_numeric(values, errors="coerce")
+    return numbers.where(numbers.between(MIN_PSU_WATTAGE, MAX_PSU_WATTAGE))
+
+
+def _first_in_range(text: pd.Series, pattern) -> pd.Series:
+    """Первое из всех совпадений шаблона в строке, попавшее в диапазон"""
+    matches = text.str.extractall(pattern)[0]
+    numbers = _in_range(matches).dropna()
+    return numbers.groupby(level=0).first().reindex(text.index)
+
+
+def psu_wattage(names: pd.Series, consumption: pd.Series) -> pd.Series:
+    """Мощность БП (Int64, <NA> если не определяется) из consumption или из названия"""
+    wattage = _in_range(clean(consumption).str.extract(CONSUMPTION_NUMBER, expand=False))
+    names = clean(names)
+    steps = (
+        lambda text: _in_range(text.str.extract(NAME_WATTS, expand=False)),
+        *(lambda text, p=p: _first_in_range(text, p) for p in MODEL_NUMBER_PATTERNS),
+        lambda text: _first_in_range(text, BARE_NUMBER),
+    )
+    for step in steps:
+        missing = wattage.isna()
+        if not missing.any():
+            break
+        wattage[missing] = step(names[missing])
+    return wattage.astype("Int64")
+
+
+def optional(values: pd.Series) -> list:
+    """Значения списком, где <NA>/NaN заменены на None"""
+    return [None if pd.isna(v) else v for v in values.astype(object)]
+
+
+if __name__ == "__main__":
+    # Бенчмарк: python -m backend.parsing.extract [строк]
+    import random
+    import sys
+    import time
+
+    ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    # Прежние построчные реализации из parser.py
+    def legacy_name_and_consumption(df, name_col, power_col):
+        results = []
+        for _, row in df.iterrows():
+            name_val = row.get(name_col)
+            consumption_val = row.get(power_col)
+            name = str(name_val).strip() if name_val is not None and pd.notna(name_val) else ''
+            consumption = str(consumption_val).strip() \
+                if consumption_val is not None and pd.notna(consumption_val) else ''
+            if name and name.lower() != 'nan' and consumption and consumption.lower() != 'nan':
+                results.append({'name': name, 'consumption': consumption})
+        return results
+
+    def legacy_extract_wattage(text):
+        if text is None or (isinstance(text, float) and pd.isna(text)):
+            return None
+        s = str(text)
+        for pattern in (r"(\d{2,5})\s*[Ww]\b", r"\b([1-9]\d{2,3})\b", r"\b([6-9]\d)\b"):
+            m = re.search(pattern, s)
+            if m:
+                return m.group(1)
+        return None
+
+    def legacy_psu_wattage(name, consumption):
+        wattage = None
+        if consumption:
+            m = re.search(r'(\d+)\s*W?', consumption, re.IGNORECASE)
+            if m:
+                wattage = int(m.group(1))
+                if not (300 <= wattage <= 2000):
+                    wattage = None
+        if wattage is None:
+            m = re.search(r'(\d+)\s*W', name, re.IGNORECASE)
+            if m:
+                wattage = int(m.group(1))
+                if not (300 <= wattage <= 2000):
+                    wattage = None
+        if wattage is None:
+            for pattern in (r'[-_](\d{3,4})[A-Z]', r'[A-Z](\d{3,4})[A-Z]'):
+                for match in re.findall(pattern, name):
+                    if 300 <= int(match) <= 2000:
+                        wattage = int(match)
+                        break
+                if wattage is not None:
+                    break
+        if wattage is None:
+            for digit in re.findall(r'\b(\d{3,4})\b', name):
+                if 300 <= int(digit) <= 2000:
+                    wattage = int(digit)
+                    break
+        return wattage
+
+    def legacy_psus(df, manufacturer_col, model_col):
+        results = []
+        for _, row in df.iterrows():
+            parts = []
+            for col in (manufacturer_col, model_col):
+                val = row.get(col)
+                if pd.notna(val) and str(val).strip().lower() != "nan":
+                    parts.append(str(val).strip())
+            name = " ".join(parts).strip()
+            watt = None
+            for col in [model_col, manufacturer_col] + [c for c in df.columns if c not in {manufacturer_col, model_col}]:
+                watt = legacy_extract_wattage(row.get(col))
+                if watt:
+                    break
+            if name:
+                results.append({'name': name, 'consumption': watt,
+                                'wattage': legacy_psu_wattage(name, (watt or '').strip())})
+        return results
+
+    def vector_psus(df, manufacturer_col, model_col):
+        others = [c for c in df.columns if c not in {manufacturer_col, model_col}]
+        watt = cell_wattage(df, [model_col, manufacturer_col, *others])
+        name = joined_name(df, (manufacturer_col, model_col))
+        wattage = psu_wattage(name, watt)
+        valid = name.ne("")
+        return [{'name': n, 'consumption': c, 'wattage': w} for n, c, w in
+                zip(name[valid], optional(watt[valid]), optional(wattage[valid]))]
+
+    rng = random.Random(17)
+    brands = ["Corsair", "be quiet!", "Seasonic", "MSI", "Thermaltake", None, "nan"]
+    models = ["RM{}x", "Pure Power 12 M {}W", "FOCUS GX-{}", "MAG A{}GL", "Toughpower GF3 {}", "SF{}L", "Mini", None]
+    powers = [450, 550, 650, 750, 850, 1000, 1200, 1600, 80, 2500]
+    psu_df = pd.DataFrame({
+        "Manufacturer": [rng.choice(brands) for _ in range(ROWS)],
+        "Model": [m.format(rng.choice(powers)) if m else None for m in (rng.choice(models) for _ in range(ROWS))],
+        "Efficiency": [rng.choice(["80+ Gold", "Platinum", "94%", None]) for _ in range(ROWS)],
+        "Noise": [rng.choice(["25 dBA", "Cybenetics A+", 31.5, None]) for _ in range(ROWS)],
+    })
+    cpu_df = pd.DataFrame({
+        "CPU Name": [rng.choice([f"Intel Core i{i % 9} {i}K", "nan", None, "  AMD Ryzen 7 7800X3D "]) for i in range(ROWS)],
+        "TDP": [rng.choice(["125 W", "65W", "", None, 170]) for _ in range(ROWS)],
+    })
+
+    cases = (
+        ("name/consumption", lambda: legacy_name_and_consumption(cpu_df, "CPU Name", "TDP"),
+         lambda: name_and_consumption(cpu_df, "CPU Name", "TDP").to_dict("records")),
+        ("PSU wattage", lambda: legacy_psus(psu_df, "Manufacturer", "Model"),
+         lambda: vector_psus(psu_df, "Manufacturer", "Model")),
+    )
+    for title, legacy, vector in cases:
+        timings = []
+        results = []
+        for run in (legacy, vector):
+            started = time.perf_counter()
+            results.append(run())
+            timings.append(time.perf_counter() - started)
+        assert results[0] == results[1], f"{title}: results differ"
+        print(f"{title:17s} {ROWS} rows: iterrows {timings[0]:6.2f}s, vectorized {timings[1]:6.2f}s "
+              f"({timings[0] / timings[1]:.0f}x)")
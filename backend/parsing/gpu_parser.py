@@ -1,148 +1,128 @@
-from __future__ import annotations
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
-
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-from bs4 import BeautifulSoup
-import pandas as pd
-
-DEFAULT_MAX_WORKERS = 12
-REQUESTS_TIMEOUT = 15.0
-
-
-def _requests_session(max_retries: int = 3, pool_connections: int = 100, pool_maxsize: int = 100) -> requests.Session:
-    s = requests.Session()
-    retries = Retry(total=max_retries, backoff_factor=0.3,
-                    status_forcelist=(429, 500, 502, 503, 504),
-                    allowed_methods=frozenset(["GET", "POST"]))
-    adapter = HTTPAdapter(max_retries=retries, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
-    s.mount("https://", adapter)
-    s.mount("http://", adapter)
-    s.headers.update({
-        "User-Agent": "Mozilla/5.0 (compatible; GPU-Scraper/1.0; +https://example.local)",
-        "Accept": "text/html,application/json,application/xhtml+xml,*/*;q=0.9",
-        "Accept-Language": "en-US,en;q=0.9",
-        "X-Requested-With": "XMLHttpRequest",
-    })
-    return s
-
-
-def _parse_table_html(html: str) -> List[Dict[str, Optional[str]]]:
-    soup = BeautifulSoup(html, "lxml")
-
-    tables = soup.find_all("table")
-    if not tables:
-        return []
-
-    def header_index_map(table):
-        thead = table.find("thead")
-        if thead:
-            headers = [th.get_text(strip=True) for th in thead.find_all("th")]
-        else:
-            first = table.find("tr")
-            if first:
-                headers = [td.get_text(strip=True) for td in first.find_all(["td", "th"])]
-            else:
-                headers = []
-
-        lower = [h.lower() for h in headers]
-
-        def find_idx(cand):
-            for i, h in enumerate(lower):
-                if cand in h:
-                    return i
-            return None
-
-        return find_idx("gpu"), find_idx("manufacturer"), find_idx("tdp")
-
-    best_rows = []
-
-    for table in tables:
-        gpu_idx, manufacturer_idx, tdp_idx = header_index_map(table)
-
-        first_row = table.find("tr")
-        if not first_row:
-            continue
-
-        colcount = len(first_row.find_all(["td", "th"]))
-        if colcount == 0:
-            continue
-
-        if gpu_idx is None:
-            gpu_idx = 0
-        if tdp_idx is None:
-            tdp_idx = max(1, colcount - 1)
-
-        trs = table.select("tbody tr")
-        if not trs:
-            trs = table.find_all("tr")
-
-        rows = []
-        for tr in trs:
-            cells = tr.find_all("td")
-            if len(cells) <= gpu_idx:
-                continue
-
-            gpu = cells[gpu_idx].get_text(strip=True)
-            man = cells[manufacturer_idx].get_text(strip=True)
-            if not gpu:
-                continue
-
-            gpu = " ".join(gpu.split())
-            man = " ".join(man.split())
-
-            if tdp_idx < len(cells):
-                raw_tdp = cells[tdp_idx].get_text(strip=True)
-                tdp = " ".join(raw_tdp.split()) if raw_tdp else None
-            else:
-                tdp = None
-
-            rows.append({"GPU Name": f'{man} {gpu}', "TDP": tdp})
-
-        if len(rows) > len(best_rows):
-            best_rows = rows
-
-    return best_rows
-
-
-def _try_requests_fastpath(base_url: str, start_page: int, end_page: int, session: requests.Session) -> Optional[
-    List[Dict[str, Optional[str]]]]:
-    params = {"page": start_page, "q": "", "sort": "name", "manufacturer": "", "architecture": "",
-              "generation": "", "memory_type": "", "bus_interface": "", "directx_version": ""}
-    try:
-        r = session.get(base_url, params=params, timeout=REQUESTS_TIMEOUT)
-    except requests.RequestException as exc:
-        return None
-
-    html = r.text or ""
-
-    parsed = _parse_table_html(html)
-    if parsed:
-        all_rows = list(parsed)
-        pages = list(range(start_page + 1, end_page + 1))
-        if pages:
-            def fetch_page(p):
-                try:
-                    rr = session.get(base_url, params={**params, "page": p}, timeout=REQUESTS_TIMEOUT)
-                    return _parse_table_html(rr.text)
-                except requests.RequestException as e:
-                    return []
-
-            with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as ex:
-                for res in ex.map(fetch_page, pages):
-                    if res:
-                        all_rows.extend(res)
-        return all_rows
-
-def parse_gpus_optimized(start_page: int = 1,
-                         end_page: int = 120,
-                         base_url: str = "https://gpus.axiomgaming.net/search") -> pd.DataFrame:
-    session = _requests_session()
-    rows = _try_requests_fastpath(base_url, start_page, end_page, session)
-
-
-    df = pd.DataFrame(rows)
-    return df
+from __future__ import annotations
+from typing import Awaitable, Callable, List, Dict, Optional
+
+import pandas as pd
+
+from . import table_extract
+from .crawler import Crawler, crawl_pages, discover_last_page, run
+from .http_cache import HTTP_CACHE_FILE
+
+BASE_URL = "https://gpus.axiomgaming.net/search"
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; GPU-Scraper/1.0; +https://example.local)"}
+
+
+def _table_rows(table) -> List[Dict[str, Optional[str]]]:
+    headers = table_extract.header(table)
+    gpu_idx = table_extract.find_column(headers, "gpu")
+    manufacturer_idx = table_extract.find_column(headers, "manufacturer")
+    tdp_idx = table_extract.find_column(headers, "tdp")
+
+    colcount = table_extract.first_row_width(table)
+    if colcount == 0:
+        return []
+
+    if gpu_idx is None:
+        gpu_idx = 0
+    if tdp_idx is None:
+        tdp_idx = max(1, colcount - 1)
+
+    rows = []
+    for tr in table_extract.body_rows(table):
+        cells = table_extract.row_cells(tr)
+        if len(cells) <= gpu_idx:
+            continue
+
+        gpu = " ".join(table_extract.text(cells[gpu_idx]).split())
+        if not gpu:
+            continue
+
+        if manufacturer_idx is not None and manufacturer_idx < len(cells):
+            man = " ".join(table_extract.text(cells[manufacturer_idx]).split())
+            gpu = f"{man} {gpu}"
+
+        if tdp_idx < len(cells):
+            raw_tdp = table_extract.text(cells[tdp_idx])
+            tdp = " ".join(raw_tdp.split()) if raw_tdp else None
+        else:
+            tdp = None
+
+        rows.append({"GPU Name": gpu, "TDP": tdp})
+    return rows
+
+
+def _parse_table_html(html: str) -> List[Dict[str, Optional[str]]]:
+    tables = table_extract.tables(html)
+
+    # Целевая таблица — первая с колонкой GPU, остальные не разбираются
+    for table in tables:
+        if table_extract.find_column(table_extract.header(table), "gpu") is not None:
+            return _table_rows(table)
+
+    best_rows = []
+    for table in tables:
+        rows = _table_rows(table)
+        if len(rows) > len(best_rows):
+            best_rows = rows
+    return best_rows
+
+
+def _parse_first_page(html: str) -> Dict:
+    return {"rows": _parse_table_html(html), "last_page": discover_last_page(html, "page")}
+
+
+async def stream_gpus(crawler: Crawler,
+                      sink: Callable[[int, List[Dict[str, Optional[str]]]], Awaitable[None]],
+                      start_page: int = 1,
+                      end_page: Optional[int] = None,
+                      base_url: str = BASE_URL) -> bool:
+    """
+    Передавать номер и строки каждой страницы в sink по мере загрузки.
+
+    Число страниц берётся из пагинации первой страницы; end_page используется,
+    только если его не удалось определить. Возвращает False, если первая
+    страница не загрузилась или пуста.
+    """
+    params = {"page": start_page, "q": "", "sort": "name", "manufacturer": "", "architecture": "",
+              "generation": "", "memory_type": "", "bus_interface": "", "directx_version": ""}
+    first = await crawler.get_parsed(base_url, _parse_first_page, params=params, headers=HEADERS)
+    if first is None:
+        return False
+
+    parsed = first["rows"]
+    if not parsed:
+        return False
+    await sink(start_page, parsed)
+
+    async def fetch_page(p):
+        return await crawler.get_parsed(base_url, _parse_table_html, params={**params, "page": p}, headers=HEADERS)
+
+    last_page = first["last_page"] or end_page
+    await crawl_pages(fetch_page, key=lambda row: row["GPU Name"], start_page=start_page + 1,
+                      last_page=last_page, seen_rows=parsed, sink=sink)
+    return True
+
+
+async def fetch_gpus(crawler: Crawler,
+                     start_page: int = 1,
+                     end_page: Optional[int] = None,
+                     base_url: str = BASE_URL) -> Optional[List[Dict[str, Optional[str]]]]:
+    rows = []
+
+    async def collect(page, page_rows):
+        rows.extend(page_rows)
+
+    if not await stream_gpus(crawler, collect, start_page, end_page, base_url):
+        return None
+    return rows
+
+
+async def fetch_gpus_df(crawler: Crawler, start_page: int = 1, end_page: Optional[int] = None,
+                        base_url: str = BASE_URL) -> pd.DataFrame:
+    return pd.DataFrame(await fetch_gpus(crawler, start_page, end_page, base_url))
+
+
+def parse_gpus_optimized(start_page: int = 1,
+                         end_page: Optional[int] = None,
+                         base_url: str = BASE_URL) -> pd.DataFrame:
+    return run(lambda crawler: fetch_gpus_df(crawler, start_page, end_page, base_url),
+               cache_path=HTTP_CACHE_FILE)
@@ -0,0 +1,112 @@
+"""
+Постоянный кэш ответов для парсеров.
+
+Для каждой страницы (URL с параметрами и парсер) хранятся ETag,
+Last-Modified, хэш тела и уже распарсенный результат. При следующем
+обновлении страница перезапрашивается условно (If-None-Match /
+If-Modified-Since); если сервер ответил 304 или тело не изменилось,
+парсинг пропускается и возвращается сохранённый результат.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Optional
+from urllib.parse import urlencode
+
+from backend.database.database import resource_path
+
+logger = logging.getLogger(__name__)
+
+# Файл кэша рядом с components.db: путь строится так же, как db_path,
+# в том числе для собранного приложения
+HTTP_CACHE_FILE = Path(resource_path("backend/.http_cache.sqlite3"))
+
+# Увеличить, если меняется формат результатов парсеров
+CACHE_VERSION = 2
+
+# Изменения фиксируются после стольких страниц или байт результатов,
+# чтобы прерванное обновление не теряло уже разобранные страницы
+COMMIT_EVERY_PAGES = 50
+COMMIT_EVERY_BYTES = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    value: Any
+
+
+def body_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    """Кэш страниц в SQLite; изменения сохраняются пачками и при close()"""
+
+    def __init__(self, path=HTTP_CACHE_FILE):
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "body_hash TEXT NOT NULL, value TEXT NOT NULL, checked_at REAL NOT NULL)"
+        )
+        self.unchanged = 0
+        self.parsed = 0
+        self._pending_pages = 0
+        self._pending_bytes = 0
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping], tag: str) -> str:
+        query = urlencode(sorted((params or {}).items()))
+        return f"{CACHE_VERSION}|{tag}|{url}|{query}"
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        row = self._conn.execute(
+            "SELECT etag, last_modified, body_hash, value FROM pages WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, digest, value = row
+        return CachedPage(etag, last_modified, digest, json.loads(value))
+
+    def _written(self, size: int = 0):
+        self._pending_pages += 1
+        self._pending_bytes += size
+        if self._pending_pages >= COMMIT_EVERY_PAGES or self._pending_bytes >= COMMIT_EVERY_BYTES:
+            self.commit()
+
+    def commit(self):
+        self._conn.commit()
+        self._pending_pages = 0
+        self._pending_bytes = 0
+
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], digest: str, value: Any):
+        self.parsed += 1
+        payload = json.dumps(value, ensure_ascii=False)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+            (key, etag, last_modified, digest, payload, time.time()),
+        )
+        self._written(len(payload))
+
+    def revalidated(self, key: str, etag: Optional[str], last_modified: Optional[str]):
+        """Страница не изменилась: обновить валидаторы, результат оставить прежним"""
+        self.unchanged += 1
+        self._conn.execute(
+            "UPDATE pages SET etag = coalesce(?, etag), last_modified = coalesce(?, last_modified), "
+            "checked_at = ? WHERE key = ?",
+            (etag, last_modified, time.time(), key),
+        )
+        self._written()
+
+    def close(self):
+        self.commit()
+        self._conn.close()
+        logger.info(f"HTTP cache: {self.unchanged} pages unchanged, {self.parsed} parsed")
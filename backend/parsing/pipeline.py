@@ -0,0 +1,99 @@
+"""
+Потоковый конвейер парсинга: загрузка -> нормализация -> запись в БД.
+
+Этапы связаны ограниченными очередями asyncio, поэтому страницы
+обрабатываются и записываются по мере поступления, а в памяти
+одновременно находится не больше queue_size страниц и batch_size
+нормализованных строк на категорию, независимо от размера каталога.
+Загрузка и разбор страниц идут в задачах загрузчика (разбор
+пропускается для страниц из HTTP-кэша), нормализация и запись —
+в отдельных задачах. Нормализация выполняется в пуле потоков, чтобы
+не задерживать обработку запросов API в том же цикле событий.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = 64
+BATCH_SIZE = 500
+# Неполная пачка записывается, если новых строк не было столько секунд
+FLUSH_INTERVAL = 1.0
+
+Sink = Callable[[str, Any], Awaitable[None]]
+
+_DONE = object()
+
+
+async def run_pipeline(producers: Iterable[Callable[[Sink], Awaitable[None]]],
+                       normalize: Callable[[str, Any], List[Dict[str, Any]]],
+                       load: Callable[[str, List[Dict[str, Any]]], Awaitable[None]],
+                       queue_size: int = QUEUE_SIZE,
+                       batch_size: int = BATCH_SIZE,
+                       flush_interval: float = FLUSH_INTERVAL):
+    """
+    Запустить конвейер.
+
+    Args:
+        producers: Корутины-источники; каждая получает sink(category, page)
+        normalize: Превращает страницу категории в строки для записи
+        load: Записывает пачку строк категории в БД
+    """
+    loop = asyncio.get_running_loop()
+    pages: asyncio.Queue = asyncio.Queue(queue_size)
+    rows: asyncio.Queue = asyncio.Queue(queue_size)
+
+    async def sink(category: str, page: Any):
+        await pages.put((category, page))
+
+    async def produce():
+        try:
+            await asyncio.gather(*(producer(sink) for producer in producers))
+        finally:
+            await pages.put(_DONE)
+
+    async def normalize_stage():
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                await rows.put(_DONE)
+                return
+            category, page = item
+            normalized = await loop.run_in_executor(None, normalize, category, page)
+            if normalized:
+                await rows.put((category, normalized))
+
+    async def load_stage():
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+
+        async def flush(category: str):
+            batch = pending.pop(category, None)
+            if batch:
+                await load(category, batch)
+
+        while True:
+            try:
+                item = await asyncio.wait_for(rows.get(), flush_interval)
+            except asyncio.TimeoutError:
+                for category in list(pending):
+                    await flush(category)
+                continue
+            if item is _DONE:
+                for category in list(pending):
+                    await flush(category)
+                return
+            category, batch = item
+            pending.setdefault(category, []).extend(batch)
+            if len(pending[category]) >= batch_size:
+                await flush(category)
+
+    tasks = [asyncio.ensure_future(stage()) for stage in (produce, normalize_stage, load_stage)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # Ошибка на любом этапе останавливает весь конвейер
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -1,20 +1,160 @@
-from __future__ import annotations
-
-
-def parse_psus_optimized():
-    from DrissionPage import Chromium, ChromiumOptions
-    import pandas as pd
-
-    co = ChromiumOptions()
-    # co.set_argument('--headless=new')
-    # co.set_argument('--no-sandbox')
-    # co.set_argument('--disable-gpu')
-
-    browser = Chromium()
-    tab = browser.latest_tab
-    tab.get('https://www.cybenetics.com/index.php?option=psu-performance-database')
-    ele = tab.ele('@@class=table table-dark table-striped table-hover mytable sub headers1stLine')
-    table = ele.html
-
-    data = pd.read_html(table)[0]
-    return data
+from __future__ import annotations
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from . import table_extract
+from .crawler import Crawler, run
+from .http_cache import HTTP_CACHE_FILE
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://www.cybenetics.com/index.php"
+PARAMS = {"option": "psu-performance-database"}
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; PSU-Scraper/1.0; +https://example.local)"}
+TABLE_CLASS = "mytable"
+
+
+def _unique(headers: List[str]) -> List[str]:
+    # Повторяющиеся заголовки получают суффиксы .1, .2, как в pd.read_html
+    counts: Dict[str, int] = {}
+    result = []
+    for h in headers:
+        n = counts.get(h, 0)
+        counts[h] = n + 1
+        result.append(f"{h}.{n}" if n else h)
+    return result
+
+
+def _parse_psu_table(html: str) -> List[Dict[str, Optional[str]]]:
+    """Строки самой большой таблицы базы cybenetics; пустые ячейки — None"""
+    best_rows = []
+    for table in table_extract.tables(html, TABLE_CLASS):
+        headers = _unique(table_extract.header(table))
+        if not headers:
+            continue
+        body = table_extract.body_rows(table)
+        if table.find("thead") is None:
+            # Без thead заголовок — первая строка таблицы
+            body = body[1:]
+        rows = []
+        for tr in body:
+            cells = [table_extract.text(td) or None for td in table_extract.row_cells(tr)]
+            if any(cells):
+                rows.append(dict(zip(headers, cells)))
+        if len(rows) > len(best_rows):
+            best_rows = rows
+    return best_rows
+
+
+def _parse_psus_browser() -> List[Dict[str, Optional[str]]]:
+    """Загрузка таблицы через headless Chromium, если страница без браузера не разобралась"""
+    from DrissionPage import Chromium, ChromiumOptions
+
+    co = ChromiumOptions()
+    co.headless(True)
+    browser = Chromium(co)
+    try:
+        tab = browser.latest_tab
+        tab.get(f"{BASE_URL}?option={PARAMS['option']}")
+        ele = tab.ele('@@class=table table-dark table-striped table-hover mytable sub headers1stLine')
+        return _parse_psu_table(ele.html)
+    finally:
+        browser.quit()
+
+
+async def fetch_psus(crawler: Crawler) -> pd.DataFrame:
+    """
+    Таблица базы PSU cybenetics.
+
+    Страница запрашивается обычным HTTP-запросом и разбирается lxml;
+    браузер запускается, только если страница не загрузилась или
+    в ней не нашлось строк таблицы.
+    """
+    rows = await crawler.get_parsed(BASE_URL, _parse_psu_table, params=PARAMS, headers=HEADERS)
+    if not rows:
+        logger.warning("PSU table not found in static page, falling back to browser")
+        try:
+            rows = await asyncio.get_running_loop().run_in_executor(None, _parse_psus_browser)
+        except Exception as e:
+            logger.error(f"Browser fallback failed: {e}")
+            rows = []
+    logger.info(f"Parsed {len(rows)} PSU rows")
+    return pd.DataFrame(rows)
+
+
+def parse_psus_optimized() -> pd.DataFrame:
+    return run(fetch_psus, cache_path=HTTP_CACHE_FILE)
+
+
+if __name__ == "__main__":
+    # Бенчмарк без сети: python -m backend.parsing.psu_parser [сохранённая страница .html]
+    # Страницу можно записать так: python -m backend.parsing.psu_parser --record cybenetics.html
+    # (tests/fixtures/cybenetics_psu.html — страница для tests/test_psu_parser.py)
+    # Без аргументов используется синтетическая страница в разметке cybenetics.
+    import sys
+    import time
+    from io import StringIO
+
+    if len(sys.argv) > 2 and sys.argv[1] == "--record":
+        async def record(crawler):
+            return await crawler.get(BASE_URL, params=PARAMS, headers=HEADERS)
+
+        page = run(record)
+        if page is None:
+            sys.exit(f"Failed to fetch {BASE_URL}")
+        with open(sys.argv[2], "w", encoding="utf-8") as f:
+            f.write(page)
+        sys.exit(0)
+
+    def synthetic_page(rows: int = 3000) -> str:
+        brands = ["Corsair", "Seasonic", "be quiet!", "MSI", "Thermaltake", "FSP"]
+        body = "".join(
+            f"<tr><td>{i}</td><td><a href='/b/{i % 6}'>{brands[i % 6]}</a></td>"
+            f"<td><a href='/m/{i}'>Model {i % 97}-{450 + 50 * (i % 24)}G</a></td>"
+            f"<td>{450 + 50 * (i % 24)}</td><td>ATX12V</td><td>{['Gold', 'Platinum', 'Titanium'][i % 3]}</td>"
+            f"<td>{87.5 + (i % 50) / 10:.1f}</td><td>{['A', 'A-', 'Standard++'][i % 3]}</td>"
+            f"<td>{20 + i % 15:.1f}</td><td></td></tr>"
+            for i in range(rows)
+        )
+        return (
+            "<html><head><script>var x = 1;</script></head><body><nav>menu</nav>"
+            "<table class='table table-dark table-striped table-hover mytable sub headers1stLine'>"
+            "<thead><tr><th>#</th><th>Manufacturer</th><th>Model</th><th>Max Power (W)</th>"
+            "<th>Form Factor</th><th>ETA Rating</th><th>Avg Efficiency (%)</th>"
+            "<th>LAMBDA Rating</th><th>Avg Noise (dBA)</th><th>Notes</th></tr></thead>"
+            f"<tbody>{body}</tbody></table></body></html>"
+        )
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            page = f.read()
+    else:
+        page = synthetic_page()
+
+    def read_html(html):
+        # Прежний разбор: pd.read_html по HTML таблицы из браузера
+        return pd.read_html(StringIO(html))[0]
+
+    reference = read_html(page)
+    parsed = pd.DataFrame(_parse_psu_table(page))
+    assert list(parsed.columns) == [str(c) for c in reference.columns], "columns differ"
+    assert len(parsed) == len(reference), "row counts differ"
+    for column, ref_column in zip(parsed.columns, reference.columns):
+        expected = reference[ref_column].map(lambda v: None if pd.isna(v) else str(v))
+        actual = parsed[column].where(parsed[column].notna(), None)
+        numeric = pd.to_numeric(actual, errors="coerce")
+        # read_html приводит числовые колонки к числам: сравниваем как числа, где это возможно
+        same = (actual == expected) | (numeric == pd.to_numeric(expected, errors="coerce")) \
+            | (actual.isna() & expected.isna())
+        assert same.all(), f"column {column} differs"
+
+    for name, parse in (("pd.read_html", read_html), ("lxml/XPath", _parse_psu_table)):
+        rounds = 5
+        started = time.perf_counter()
+        for _ in range(rounds):
+            parse(page)
+        elapsed = (time.perf_counter() - started) / rounds
+        print(f"{name:13s} {elapsed * 1000:8.1f} ms per page ({len(reference)} rows)")
@@ -0,0 +1,155 @@
+"""
+Извлечение колонок из HTML-таблиц на lxml.
+
+Страница разбирается парсером lxml.html без построения дерева
+BeautifulSoup, таблицы и строки выбираются заранее скомпилированными
+XPath-выражениями, а текст берётся только из нужных ячеек.
+Текст ячейки собирается так же, как BeautifulSoup.get_text(strip=True).
+"""
+from typing import Iterable, List, Optional, Sequence
+
+import lxml.html
+from lxml import etree
+
+_TABLES = etree.XPath("//table")
+_TABLES_BY_CLASS = etree.XPath(
+    "//table[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $cls, ' '))]"
+)
+_HEAD_CELLS = etree.XPath("thead//th")
+_FIRST_ROW_CELLS = etree.XPath("(.//tr)[1]/*[self::td or self::th]")
+_BODY_ROWS = etree.XPath("tbody//tr")
+_ALL_ROWS = etree.XPath(".//tr")
+_ROW_CELLS = etree.XPath(".//td")
+
+
+def tables(html: str, table_class: Optional[str] = None) -> List[etree._Element]:
+    """Все таблицы страницы (или только с классом table_class) в порядке документа"""
+    if not html or not html.strip():
+        return []
+    try:
+        doc = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return []
+    if table_class is not None:
+        return _TABLES_BY_CLASS(doc, cls=table_class)
+    return _TABLES(doc)
+
+
+def text(cell) -> str:
+    return "".join(part.strip() for part in cell.itertext())
+
+
+def header(table) -> List[str]:
+    """Заголовки из thead, а если его нет, то из первой строки таблицы"""
+    cells = _HEAD_CELLS(table)
+    if not cells and table.find("thead") is None:
+        cells = _FIRST_ROW_CELLS(table)
+    return [text(cell) for cell in cells]
+
+
+def first_row_width(table) -> int:
+    return len(_FIRST_ROW_CELLS(table))
+
+
+def find_column(headers: Sequence[str], *candidates: str) -> Optional[int]:
+    """Индекс первой колонки, в заголовке которой (без учёта регистра) есть одна из подстрок"""
+    lowered = [h.lower() for h in headers]
+    for i, h in enumerate(lowered):
+        if any(c in h for c in candidates):
+            return i
+    return None
+
+
+def body_rows(table) -> Iterable:
+    """Строки из tbody, а если его нет, то все строки таблицы"""
+    return _BODY_ROWS(table) or _ALL_ROWS(table)
+
+
+def row_cells(row) -> list:
+    return _ROW_CELLS(row)
+
+
+if __name__ == "__main__":
+    # Микробенчмарк: python -m backend.parsing.table_extract [сохранённые страницы .html ...]
+    # Без аргументов используются синтетические страницы в разметке axiomgaming.
+    import sys
+    import time
+
+    from bs4 import BeautifulSoup
+
+    from backend.parsing.gpu_parser import _parse_table_html
+
+    def bs4_parse_table_html(html):
+        # Прежняя реализация gpu_parser._parse_table_html на BeautifulSoup
+        soup = BeautifulSoup(html, "lxml")
+        best_rows = []
+        for table in soup.find_all("table"):
+            thead = table.find("thead")
+            if thead:
+                headers = [th.get_text(strip=True) for th in thead.find_all("th")]
+            else:
+                first = table.find("tr")
+                headers = [td.get_text(strip=True) for td in first.find_all(["td", "th"])] if first else []
+            lower = [h.lower() for h in headers]
+            idx = {c: next((i for i, h in enumerate(lower) if c in h), None) for c in ("gpu", "manufacturer", "tdp")}
+            first_row = table.find("tr")
+            if not first_row:
+                continue
+            colcount = len(first_row.find_all(["td", "th"]))
+            if colcount == 0:
+                continue
+            gpu_idx = idx["gpu"] if idx["gpu"] is not None else 0
+            tdp_idx = idx["tdp"] if idx["tdp"] is not None else max(1, colcount - 1)
+            man_idx = idx["manufacturer"]
+            rows = []
+            for tr in table.select("tbody tr") or table.find_all("tr"):
+                cells = tr.find_all("td")
+                if len(cells) <= gpu_idx:
+                    continue
+                gpu = " ".join(cells[gpu_idx].get_text(strip=True).split())
+                if not gpu:
+                    continue
+                if man_idx is not None and man_idx < len(cells):
+                    gpu = f"{' '.join(cells[man_idx].get_text(strip=True).split())} {gpu}"
+                raw_tdp = cells[tdp_idx].get_text(strip=True) if tdp_idx < len(cells) else None
+                rows.append({"GPU Name": gpu, "TDP": " ".join(raw_tdp.split()) if raw_tdp else None})
+            if len(rows) > len(best_rows):
+                best_rows = rows
+        return best_rows
+
+    def synthetic_page(page: int, rows: int = 50) -> str:
+        nav = "".join(f'<li><a href="/search?page={i}">{i}</a></li>' for i in range(1, 121))
+        body = "".join(
+            f"<tr><td><a href='/gpu/{page}-{i}'>GeForce <b>RTX</b> {page}{i:02d}</a></td>"
+            f"<td><span>NVIDIA</span></td><td>AD10{i % 4}</td><td>Ada Lovelace</td>"
+            f"<td>{8 + i % 16} GB GDDR6X</td><td>PCIe 4.0 x16</td><td>{100 + i} W</td></tr>"
+            for i in range(rows)
+        )
+        return (
+            "<html><head><script>var x = 1;</script><style>td{padding:0}</style></head><body>"
+            f"<nav><ul>{nav}</ul></nav>"
+            "<table class='legend'><tr><td>Legend</td><td>text</td></tr></table>"
+            "<table class='results'><thead><tr><th>GPU</th><th>Manufacturer</th><th>Chip</th>"
+            "<th>Architecture</th><th>Memory</th><th>Bus</th><th>TDP</th></tr></thead>"
+            f"<tbody>{body}</tbody></table><footer>{'<p>footer</p>' * 50}</footer></body></html>"
+        )
+
+    if len(sys.argv) > 1:
+        pages = []
+        for path in sys.argv[1:]:
+            with open(path, encoding="utf-8") as f:
+                pages.append(f.read())
+    else:
+        pages = [synthetic_page(p) for p in range(1, 41)]
+
+    for page in pages:
+        assert _parse_table_html(page) == bs4_parse_table_html(page), "results differ"
+
+    for name, parse in (("BeautifulSoup", bs4_parse_table_html), ("lxml/XPath", _parse_table_html)):
+        rounds = 5
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for page in pages:
+                parse(page)
+        elapsed = time.perf_counter() - started
+        print(f"{name:14s} {rounds * len(pages) / elapsed:8.1f} pages/s")
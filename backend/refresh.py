@@ -0,0 +1,112 @@
+"""
+Фоновое обновление каталога из источников.
+
+RefreshManager создаётся в lifespan приложения и запускает
+parse_and_load_data в отдельной задаче по запросу POST /refresh, а
+при AUTO_REFRESH ещё и по расписанию, когда update_tracker.should_update()
+сообщает, что пора. Обновление пишет в теневые таблицы и подменяет живые
+одной транзакцией; до этого роуты отдают прежний снимок каталога,
+после — перезагруженный.
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from backend.catalog import CatalogStore
+from backend.parsing import REFRESH_CATEGORIES, parse_and_load_data
+from backend.parsing.update_tracker import should_update
+
+logger = logging.getLogger(__name__)
+
+# Обновление по расписанию включается переменной окружения COMPONENTS_AUTO_REFRESH=1
+AUTO_REFRESH = os.environ.get("COMPONENTS_AUTO_REFRESH", "").strip().lower() in ("1", "true", "yes", "on")
+# Как часто проверять, не пора ли обновить каталог по расписанию
+CHECK_INTERVAL = 600.0
+
+
+class RefreshManager:
+    """Не больше одного обновления одновременно; состояние последнего — в status()"""
+
+    def __init__(self, session_maker, catalog: CatalogStore, check_interval: float = CHECK_INTERVAL):
+        self._session_maker = session_maker
+        self._catalog = catalog
+        self._check_interval = check_interval
+        self._task: Optional[asyncio.Task] = None
+        self._scheduler: Optional[asyncio.Task] = None
+        self._progress: Dict[str, Any] = {}
+        self._started_at: Optional[datetime] = None
+        self._finished_at: Optional[datetime] = None
+        self._error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def refreshing(self, category: str) -> bool:
+        """Идёт обновление, которое при подмене записей заменит записи категории"""
+        return self.running and category in REFRESH_CATEGORIES
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "phase": self._progress.get("phase"),
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "finished_at": self._finished_at.isoformat() if self._finished_at else None,
+            "error": self._error,
+            "stats": self._progress.get("stats"),
+        }
+
+    def start(self) -> bool:
+        """Запустить обновление; False, если оно уже идёт"""
+        if self.running:
+            return False
+        self._progress = {"phase": "starting"}
+        self._started_at = datetime.now()
+        self._finished_at = None
+        self._error = None
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    async def _run(self):
+        # Промежуточные записи в теневые таблицы не должны перезагружать снимок
+        await self._catalog.stop_watching()
+        try:
+            await parse_and_load_data(self._session_maker, progress=self._progress)
+            await self._catalog.reload()
+        except asyncio.CancelledError:
+            self._error = "cancelled"
+            raise
+        except Exception as e:
+            self._error = str(e)
+            logger.error(f"Ошибка при обновлении каталога: {e}")
+        finally:
+            self._finished_at = datetime.now()
+            self._catalog.start_watching()
+
+    async def _schedule(self):
+        while True:
+            await asyncio.sleep(self._check_interval)
+            try:
+                if not self.running and should_update():
+                    logger.info("Запускаю плановое обновление каталога")
+                    self.start()
+            except Exception as e:
+                logger.warning(f"Ошибка планировщика обновлений: {e}")
+
+    def start_schedule(self):
+        if self._scheduler is None:
+            self._scheduler = asyncio.create_task(self._schedule())
+
+    async def stop(self):
+        """Остановить планировщик и прервать идущее обновление (живые таблицы не меняются)"""
+        for task in (self._scheduler, self._task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._scheduler = None
+        self._task = None
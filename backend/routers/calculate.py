@@ -0,0 +1,138 @@
+import math
+from typing import List
+import numpy as np
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+from backend.dependencies import CatalogDep
+from backend.schemas.schemas import CalculationRequest
+
+router = APIRouter(prefix="/calculate", tags=["Calculation"])
+
+OVERHEAD = 200
+TOP_PSUS = 5
+
+# Категории, где consumption уже хранится числом, а не строкой вида "65 W"
+INTEGER_CATEGORIES = {"cooling", "drives", "motherboards"}
+
+
+class _Resolver:
+    """Поиск мощности компонентов в снимке каталога с кэшем по (категория, название)"""
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+        self._cache = {}
+
+    def find_watts(self, category: str, name):
+        """Мощность найденного компонента или None, если он не найден"""
+        key = (category, name)
+        if key not in self._cache:
+            entry = self._snapshot[category].find(name)
+            if entry is None:
+                watts = None
+            elif category in INTEGER_CATEGORIES:
+                watts = int(entry["consumption"] or 0)
+            else:
+                watts = entry["watts"] or 0
+            self._cache[key] = watts
+        return self._cache[key]
+
+    def watts(self, category: str, name) -> int:
+        return self.find_watts(category, name) or 0
+
+    def breakdown(self, calc_data: CalculationRequest) -> dict:
+        ram_w_single = self.watts("ram", calc_data.ram_name)
+
+        storage_w = 0
+        storage_details = []
+        for storage_name in calc_data.storage_names:
+            if storage_name.strip():
+                storage_power = self.find_watts("storages", storage_name)
+                if storage_power is not None:
+                    storage_w += storage_power
+                    storage_details.append({
+                        "name": storage_name,
+                        "consumption": storage_power
+                    })
+
+        return {
+            "cpu_w": self.watts("cpus", calc_data.cpu_name),
+            "gpu_w": self.watts("gpus", calc_data.gpu_name),
+            "ram_w": ram_w_single * calc_data.ram_modules,
+            "ram_modules": calc_data.ram_modules,
+            "ram_w_single": ram_w_single,
+            "storage_w": storage_w,
+            "storage_details": storage_details,
+            "cooling_w": self.watts("cooling", calc_data.cooling_name),
+            "drive_w": self.watts("drives", calc_data.drive_name),
+            "motherboard_w": self.watts("motherboards", calc_data.motherboard_name),
+        }
+
+
+POWER_PARTS = ("cpu_w", "gpu_w", "ram_w", "storage_w", "cooling_w", "drive_w", "motherboard_w")
+
+
+def _raw_total(parts: dict) -> int:
+    return sum(parts[key] for key in POWER_PARTS) + OVERHEAD
+
+
+def _result(parts: dict, power_margin, raw_total: int, required: int, psus) -> dict:
+    return {
+        "required": required,
+        **parts,
+        "overhead": OVERHEAD,
+        "power_margin": power_margin,
+        "raw_total": raw_total,
+        "psus": psus
+    }
+
+
+def _psu_list(psus) -> list:
+    return [{"name": p["name"], "wattage": p["watts"]} for p in psus]
+
+
+@router.post("/")
+async def calculate(calc_data: CalculationRequest, catalog: CatalogDep):
+    try:
+        snapshot = catalog.snapshot
+        parts = _Resolver(snapshot).breakdown(calc_data)
+
+        raw_total = _raw_total(parts)
+        margin_multiplier = 1.0 + (calc_data.power_margin / 100.0)
+        required = math.ceil(raw_total * margin_multiplier)
+
+        psus = _psu_list(snapshot["psus"].at_least(required, TOP_PSUS))
+        return {"success": True, "data": _result(parts, calc_data.power_margin, raw_total, required, psus)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error calculating configuration: {str(e)}")
+
+
+@router.post("/batch")
+async def calculate_batch(builds: List[CalculationRequest], catalog: CatalogDep):
+    try:
+        snapshot = catalog.snapshot
+        resolver = _Resolver(snapshot)
+        parts = [resolver.breakdown(build) for build in builds]
+        if not parts:
+            return JSONResponse({"success": True, "data": []})
+
+        watts = np.array([[p[key] for key in POWER_PARTS] for p in parts], dtype=np.int64)
+        raw_total = watts.sum(axis=1) + OVERHEAD
+        margin = np.fromiter((b.power_margin for b in builds), dtype=np.float64, count=len(builds))
+        required = np.ceil(raw_total * (1.0 + margin / 100.0)).astype(np.int64)
+
+        psu_index = snapshot["psus"]
+        starts = np.searchsorted(psu_index.watts_array, required, side="left")
+
+        # У многих сборок совпадает позиция в индексе БП, список строится один раз на позицию
+        top_by_start = {}
+        results = []
+        for i, build in enumerate(builds):
+            start = int(starts[i])
+            psus = top_by_start.get(start)
+            if psus is None:
+                psus = top_by_start[start] = _psu_list(psu_index.by_watts[start:start + TOP_PSUS])
+            results.append(_result(parts[i], build.power_margin, int(raw_total[i]), int(required[i]), psus))
+        # Результат состоит только из JSON-типов, поэтому jsonable_encoder не нужен
+        return JSONResponse({"success": True, "data": results})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error calculating configurations: {str(e)}")
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from dependencies import CatalogDep, catalog_etag
+
+router = APIRouter(prefix="/catalog", tags=["Catalog"])
+
+@router.get("/", dependencies=[Depends(catalog_etag())])
+async def get_catalog(request: Request, catalog: CatalogDep):
+    try:
+        return catalog.snapshot.bundle_response(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching catalog: {str(e)}")
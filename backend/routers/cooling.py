@@ -1,43 +1,60 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from backend.dependencies import SessionDep
-from backend.database.models import Cooling
-from backend.schemas.schemas import CoolingCreate
-
-router = APIRouter(prefix="/cooling", tags=["Cooling"])
-
-@router.post("/")
-async def create_cooling(cooling_data: CoolingCreate, session: SessionDep):
-    try:
-        cooling = Cooling(**cooling_data.model_dump())
-        session.add(cooling)
-        await session.commit()
-        await session.refresh(cooling)
-        return {"success": True, "data": cooling}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating Cooling: {str(e)}")
-
-@router.get("/")
-async def get_cooling(session: SessionDep):
-    try:
-        result = await session.execute(select(Cooling))
-        cooling = result.scalars().all()
-        return {"success": True, "data": cooling}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching Cooling: {str(e)}")
-
-@router.get("/{cooling_name}")
-async def get_cooling_by_name(cooling_name: str, session: SessionDep):
-    try:
-        result = await session.execute(
-            select(Cooling).where(Cooling.name.ilike(f"%{cooling_name}%"))
-        )
-        cooling = result.scalars().all()
-        if not cooling:
-            raise HTTPException(status_code=404, detail="Cooling not found")
-        return {"success": True, "data": cooling}
-    except HTTPException:
-        raise
-    except Exception as e:
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from backend.dependencies import SessionDep, ReadSessionDep, CatalogDep, ListParamsDep, catalog_etag
+from backend.database.models import Cooling
+from backend.database.versions import bump_versions
+from backend.database.bulk import bulk_upsert
+from backend.database.fts import search_by_name
+from backend.schemas.schemas import CoolingCreate
+
+router = APIRouter(prefix="/cooling", tags=["Cooling"])
+
+@router.post("/")
+async def create_cooling(cooling_data: CoolingCreate, session: SessionDep, catalog: CatalogDep):
+    try:
+        cooling = Cooling(**cooling_data.model_dump())
+        session.add(cooling)
+        await bump_versions(session, ["cooling"])
+        await session.commit()
+        await session.refresh(cooling)
+        await catalog.reload()
+        return {"success": True, "data": cooling}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating Cooling: {str(e)}")
+
+@router.post("/bulk")
+async def create_cooling_bulk(cooling_data: List[CoolingCreate], session: SessionDep, catalog: CatalogDep):
+    try:
+        inserted, updated = await bulk_upsert(session, Cooling, [item.model_dump() for item in cooling_data])
+        await bump_versions(session, ["cooling"])
+        await session.commit()
+        await catalog.reload()
+        return {"success": True, "inserted": inserted, "updated": updated}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error bulk creating Cooling: {str(e)}")
+
+@router.get("/", dependencies=[Depends(catalog_etag("cooling"))])
+async def get_cooling(request: Request, catalog: CatalogDep, params: ListParamsDep):
+    try:
+        if params.is_full:
+            return catalog.snapshot.list_response(request, "cooling")
+        cooling, next_after = catalog.snapshot["cooling"].page(params.after, params.limit, params.fields)
+        return {"success": True, "data": cooling, "next_after": next_after}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching Cooling: {str(e)}")
+
+@router.get("/{cooling_name}", dependencies=[Depends(catalog_etag("cooling"))])
+async def get_cooling_by_name(cooling_name: str, session: ReadSessionDep, limit: Optional[int] = Query(None, ge=1)):
+    try:
+        cooling = await search_by_name(session, Cooling, cooling_name, limit)
+        if not cooling:
+            raise HTTPException(status_code=404, detail="Cooling not found")
+        return {"success": True, "data": cooling}
+    except HTTPException:
+        raise
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching Cooling: {str(e)}")
\ No newline at end of file
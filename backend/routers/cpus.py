@@ -1,81 +1,69 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from dependencies import SessionDep
-from database.models import CPU
-from schemas.schemas import CPUCreate
-
-router = APIRouter(prefix="/cpus", tags=["CPUs"])
-
-@router.post("/")
-async def create_cpu(cpu_data: CPUCreate, session: SessionDep):
-    try:
-        cpu = CPU(**cpu_data.model_dump())
-        session.add(cpu)
-        await session.commit()
-        await session.refresh(cpu)
-        return {"success": True, "data": cpu}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating CPU: {str(e)}")
-
-@router.get("/")
-async def get_cpus(session: SessionDep):
-    try:
-        result = await session.execute(select(CPU))
-        cpus = result.scalars().all()
-        return {"success": True, "data": cpus}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching CPUs: {str(e)}")
-
-@router.get("/{cpu_name}")
-async def get_cpu_by_name(cpu_name: str, session: SessionDep):
-    try:
-        result = await session.execute(
-            select(CPU).where(CPU.name.ilike(f"%{cpu_name}%"))
-        )
-        cpus = result.scalars().all()
-        if not cpus:
-            raise HTTPException(status_code=404, detail="CPUs not found")
-        return {"success": True, "data": cpus}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching CPUs: {str(e)}")
-
-router = APIRouter(prefix="/cpus", tags=["CPUs"])
-
-@router.post("/")
-async def create_cpu(cpu_data: CPUCreate, session: SessionDep):
-    try:
-        cpu = CPU(**cpu_data.model_dump())
-        session.add(cpu)
-        await session.commit()
-        await session.refresh(cpu)
-        return {"success": True, "data": cpu}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating CPU: {str(e)}")
-
-@router.get("/")
-async def get_cpus(session: SessionDep):
-    try:
-        result = await session.execute(select(CPU))
-        cpus = result.scalars().all()
-        return {"success": True, "data": cpus}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching CPUs: {str(e)}")
-
-@router.get("/{cpu_name}")
-async def get_cpu_by_name(cpu_name: str, session: SessionDep):
-    try:
-        result = await session.execute(
-            select(CPU).where(CPU.name.ilike(f"%{cpu_name}%"))
-        )
-        cpus = result.scalars().all()
-        if not cpus:
-            raise HTTPException(status_code=404, detail="CPUs not found")
-        return {"success": True, "data": cpus}
-    except HTTPException:
-        raise
-    except Exception as e:
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from dependencies import SessionDep, ReadSessionDep, CatalogDep, RefreshDep, ListParamsDep, catalog_etag, \
+    ensure_not_refreshing
+from database.models import CPU
+from database.versions import bump_versions
+from database.bulk import bulk_upsert
+from database.fts import search_by_name
+from schemas.schemas import CPUCreate
+
+router = APIRouter(prefix="/cpus", tags=["CPUs"])
+
+@router.post("/")
+async def create_cpu(cpu_data: CPUCreate, session: SessionDep, catalog: CatalogDep, refresh: RefreshDep):
+    try:
+        cpu = CPU(**cpu_data.model_dump())
+        session.add(cpu)
+        await bump_versions(session, ["cpus"])
+        ensure_not_refreshing(refresh, "cpus")
+        await session.commit()
+        await session.refresh(cpu)
+        await catalog.reload()
+        return {"success": True, "data": cpu}
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating CPU: {str(e)}")
+
+@router.post("/bulk")
+async def create_cpus_bulk(cpu_data: List[CPUCreate], session: SessionDep, catalog: CatalogDep, refresh: RefreshDep):
+    try:
+        inserted, updated = await bulk_upsert(session, CPU, [item.model_dump() for item in cpu_data])
+        await bump_versions(session, ["cpus"])
+        ensure_not_refreshing(refresh, "cpus")
+        await session.commit()
+        await catalog.reload()
+        return {"success": True, "inserted": inserted, "updated": updated}
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error bulk creating CPUs: {str(e)}")
+
+@router.get("/", dependencies=[Depends(catalog_etag("cpus"))])
+async def get_cpus(request: Request, catalog: CatalogDep, params: ListParamsDep):
+    try:
+        if params.is_full:
+            return catalog.snapshot.list_response(request, "cpus")
+        cpus, next_after = catalog.snapshot["cpus"].page(params.after, params.limit, params.fields)
+        return {"success": True, "data": cpus, "next_after": next_after}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching CPUs: {str(e)}")
+
+@router.get("/{cpu_name}", dependencies=[Depends(catalog_etag("cpus"))])
+async def get_cpu_by_name(cpu_name: str, session: ReadSessionDep, limit: Optional[int] = Query(None, ge=1)):
+    try:
+        cpus = await search_by_name(session, CPU, cpu_name, limit)
+        if not cpus:
+            raise HTTPException(status_code=404, detail="CPUs not found")
+        return {"success": True, "data": cpus}
+    except HTTPException:
+        raise
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching CPUs: {str(e)}")
\ No newline at end of file
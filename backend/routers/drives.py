@@ -1,28 +1,47 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from backend.dependencies import SessionDep
-from backend.database.models import Drive
-from backend.schemas.schemas import DriveCreate
-
-router = APIRouter(prefix="/drives", tags=["Drives"])
-
-@router.post("/")
-async def create_drive(drive_data: DriveCreate, session: SessionDep):
-    try:
-        drive = Drive(**drive_data.model_dump())
-        session.add(drive)
-        await session.commit()
-        await session.refresh(drive)
-        return {"success": True, "data": drive}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating Drive: {str(e)}")
-
-@router.get("/")
-async def get_drives(session: SessionDep):
-    try:
-        result = await session.execute(select(Drive))
-        drives = result.scalars().all()
-        return {"success": True, "data": drives}
-    except Exception as e:
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request
+from backend.dependencies import SessionDep, CatalogDep, ListParamsDep, catalog_etag
+from backend.database.models import Drive
+from backend.database.versions import bump_versions
+from backend.database.bulk import bulk_upsert
+from backend.schemas.schemas import DriveCreate
+
+router = APIRouter(prefix="/drives", tags=["Drives"])
+
+@router.post("/")
+async def create_drive(drive_data: DriveCreate, session: SessionDep, catalog: CatalogDep):
+    try:
+        drive = Drive(**drive_data.model_dump())
+        session.add(drive)
+        await bump_versions(session, ["drives"])
+        await session.commit()
+        await session.refresh(drive)
+        await catalog.reload()
+        return {"success": True, "data": drive}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating Drive: {str(e)}")
+
+@router.post("/bulk")
+async def create_drives_bulk(drive_data: List[DriveCreate], session: SessionDep, catalog: CatalogDep):
+    try:
+        inserted, updated = await bulk_upsert(session, Drive, [item.model_dump() for item in drive_data])
+        await bump_versions(session, ["drives"])
+        await session.commit()
+        await catalog.reload()
+        return {"success": True, "inserted": inserted, "updated": updated}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error bulk creating Drives: {str(e)}")
+
+@router.get("/", dependencies=[Depends(catalog_etag("drives"))])
+async def get_drives(request: Request, catalog: CatalogDep, params: ListParamsDep):
+    try:
+        if params.is_full:
+            return catalog.snapshot.list_response(request, "drives")
+        drives, next_after = catalog.snapshot["drives"].page(params.after, params.limit, params.fields)
+        return {"success": True, "data": drives, "next_after": next_after}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching drives: {str(e)}")
\ No newline at end of file
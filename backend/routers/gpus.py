@@ -1,43 +1,69 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from dependencies import SessionDep
-from database.models import GPU
-from schemas.schemas import GPUCreate
-
-router = APIRouter(prefix="/gpus", tags=["GPUs"])
-
-@router.post("/")
-async def create_gpu(gpu_data: GPUCreate, session: SessionDep):
-    try:
-        gpu = GPU(**gpu_data.model_dump())
-        session.add(gpu)
-        await session.commit()
-        await session.refresh(gpu)
-        return {"success": True, "data": gpu}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating GPU: {str(e)}")
-
-@router.get("/")
-async def get_gpus(session: SessionDep):
-    try:
-        result = await session.execute(select(GPU))
-        gpus = result.scalars().all()
-        return {"success": True, "data": gpus}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching GPUs: {str(e)}")
-
-@router.get("/{gpu_name}")
-async def get_gpu_by_name(gpu_name: str, session: SessionDep):
-    try:
-        result = await session.execute(
-            select(GPU).where(GPU.name.ilike(f"%{gpu_name}%"))
-        )
-        gpus = result.scalars().all()
-        if not gpus:
-            raise HTTPException(status_code=404, detail="GPUs not found")
-        return {"success": True, "data": gpus}
-    except HTTPException:
-        raise
-    except Exception as e:
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from dependencies import SessionDep, ReadSessionDep, CatalogDep, RefreshDep, ListParamsDep, catalog_etag, \
+    ensure_not_refreshing
+from database.models import GPU
+from database.versions import bump_versions
+from database.bulk import bulk_upsert
+from database.fts import search_by_name
+from schemas.schemas import GPUCreate
+
+router = APIRouter(prefix="/gpus", tags=["GPUs"])
+
+@router.post("/")
+async def create_gpu(gpu_data: GPUCreate, session: SessionDep, catalog: CatalogDep, refresh: RefreshDep):
+    try:
+        gpu = GPU(**gpu_data.model_dump())
+        session.add(gpu)
+        await bump_versions(session, ["gpus"])
+        ensure_not_refreshing(refresh, "gpus")
+        await session.commit()
+        await session.refresh(gpu)
+        await catalog.reload()
+        return {"success": True, "data": gpu}
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating GPU: {str(e)}")
+
+@router.post("/bulk")
+async def create_gpus_bulk(gpu_data: List[GPUCreate], session: SessionDep, catalog: CatalogDep, refresh: RefreshDep):
+    try:
+        inserted, updated = await bulk_upsert(session, GPU, [item.model_dump() for item in gpu_data])
+        await bump_versions(session, ["gpus"])
+        ensure_not_refreshing(refresh, "gpus")
+        await session.commit()
+        await catalog.reload()
+        return {"success": True, "inserted": inserted, "updated": updated}
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error bulk creating GPUs: {str(e)}")
+
+@router.get("/", dependencies=[Depends(catalog_etag("gpus"))])
+async def get_gpus(request: Request, catalog: CatalogDep, params: ListParamsDep):
+    try:
+        if params.is_full:
+            return catalog.snapshot.list_response(request, "gpus")
+        gpus, next_after = catalog.snapshot["gpus"].page(params.after, params.limit, params.fields)
+        return {"success": True, "data": gpus, "next_after": next_after}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching GPUs: {str(e)}")
+
+@router.get("/{gpu_name}", dependencies=[Depends(catalog_etag("gpus"))])
+async def get_gpu_by_name(gpu_name: str, session: ReadSessionDep, limit: Optional[int] = Query(None, ge=1)):
+    try:
+        gpus = await search_by_name(session, GPU, gpu_name, limit)
+        if not gpus:
+            raise HTTPException(status_code=404, detail="GPUs not found")
+        return {"success": True, "data": gpus}
+    except HTTPException:
+        raise
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching GPUs: {str(e)}")
\ No newline at end of file
@@ -1,28 +1,47 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from backend.dependencies import SessionDep
-from backend.database.models import Motherboard
-from backend.schemas.schemas import MotherboardCreate
-
-router = APIRouter(prefix="/motherboards", tags=["Motherboards"])
-
-@router.post("/")
-async def create_motherboard(motherboard_data: MotherboardCreate, session: SessionDep):
-    try:
-        motherboard = Motherboard(**motherboard_data.model_dump())
-        session.add(motherboard)
-        await session.commit()
-        await session.refresh(motherboard)
-        return {"success": True, "data": motherboard}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating Motherboard: {str(e)}")
-
-@router.get("/")
-async def get_motherboards(session: SessionDep):
-    try:
-        result = await session.execute(select(Motherboard))
-        motherboards = result.scalars().all()
-        return {"success": True, "data": motherboards}
-    except Exception as e:
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request
+from backend.dependencies import SessionDep, CatalogDep, ListParamsDep, catalog_etag
+from backend.database.models import Motherboard
+from backend.database.versions import bump_versions
+from backend.database.bulk import bulk_upsert
+from backend.schemas.schemas import MotherboardCreate
+
+router = APIRouter(prefix="/motherboards", tags=["Motherboards"])
+
+@router.post("/")
+async def create_motherboard(motherboard_data: MotherboardCreate, session: SessionDep, catalog: CatalogDep):
+    try:
+        motherboard = Motherboard(**motherboard_data.model_dump())
+        session.add(motherboard)
+        await bump_versions(session, ["motherboards"])
+        await session.commit()
+        await session.refresh(motherboard)
+        await catalog.reload()
+        return {"success": True, "data": motherboard}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating Motherboard: {str(e)}")
+
+@router.post("/bulk")
+async def create_motherboards_bulk(motherboard_data: List[MotherboardCreate], session: SessionDep, catalog: CatalogDep):
+    try:
+        inserted, updated = await bulk_upsert(session, Motherboard, [item.model_dump() for item in motherboard_data])
+        await bump_versions(session, ["motherboards"])
+        await session.commit()
+        await catalog.reload()
+        return {"success": True, "inserted": inserted, "updated": updated}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error bulk creating Motherboards: {str(e)}")
+
+@router.get("/", dependencies=[Depends(catalog_etag("motherboards"))])
+async def get_motherboards(request: Request, catalog: CatalogDep, params: ListParamsDep):
+    try:
+        if params.is_full:
+            return catalog.snapshot.list_response(request, "motherboards")
+        motherboards, next_after = catalog.snapshot["motherboards"].page(params.after, params.limit, params.fields)
+        return {"success": True, "data": motherboards, "next_after": next_after}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching motherboards: {str(e)}")
\ No newline at end of file
@@ -1,43 +1,83 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from dependencies import SessionDep
-from database.models import PSU
-from schemas.schemas import PSUCreate
-
-router = APIRouter(prefix="/psus", tags=["PSUs"])
-
-@router.post("/")
-async def create_psu(psu_data: PSUCreate, session: SessionDep):
-    try:
-        psu = PSU(**psu_data.model_dump())
-        session.add(psu)
-        await session.commit()
-        await session.refresh(psu)
-        return {"success": True, "data": psu}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating PSUs: {str(e)}")
-
-@router.get("/")
-async def get_psus(session: SessionDep):
-    try:
-        result = await session.execute(select(PSU))
-        psus = result.scalars().all()
-        return {"success": True, "data": psus}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching PSUs: {str(e)}")
-
-@router.get("/{psu_name}")
-async def get_psu_by_name(psu_name: str, session: SessionDep):
-    try:
-        result = await session.execute(
-            select(PSU).where(PSU.name.ilike(f"%{psu_name}%"))
-        )
-        psus = result.scalars().all()
-        if not psus:
-            raise HTTPException(status_code=404, detail="PSUs not found")
-        return {"success": True, "data": psus}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching PSUs: {str(e)}")
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from dependencies import SessionDep, ReadSessionDep, CatalogDep, RefreshDep, ListParamsDep, catalog_etag, \
+    ensure_not_refreshing
+from database.models import PSU
+from database.versions import bump_versions
+from database.bulk import bulk_upsert
+from database.fts import search_by_name
+from schemas.schemas import PSUCreate
+
+router = APIRouter(prefix="/psus", tags=["PSUs"])
+
+@router.post("/")
+async def create_psu(psu_data: PSUCreate, session: SessionDep, catalog: CatalogDep, refresh: RefreshDep):
+    try:
+        psu = PSU(**psu_data.model_dump())
+        session.add(psu)
+        await bump_versions(session, ["psus"])
+        ensure_not_refreshing(refresh, "psus")
+        await session.commit()
+        await session.refresh(psu)
+        await catalog.reload()
+        return {"success": True, "data": psu}
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating PSUs: {str(e)}")
+
+@router.post("/bulk")
+async def create_psus_bulk(psu_data: List[PSUCreate], session: SessionDep, catalog: CatalogDep, refresh: RefreshDep):
+    try:
+        inserted, updated = await bulk_upsert(session, PSU, [item.model_dump() for item in psu_data])
+        await bump_versions(session, ["psus"])
+        ensure_not_refreshing(refresh, "psus")
+        await session.commit()
+        await catalog.reload()
+        return {"success": True, "inserted": inserted, "updated": updated}
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error bulk creating PSUs: {str(e)}")
+
+@router.get("/", dependencies=[Depends(catalog_etag("psus"))])
+async def get_psus(request: Request, catalog: CatalogDep, params: ListParamsDep):
+    try:
+        if params.is_full:
+            return catalog.snapshot.list_response(request, "psus")
+        psus, next_after = catalog.snapshot["psus"].page(params.after, params.limit, params.fields)
+        return {"success": True, "data": psus, "next_after": next_after}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching PSUs: {str(e)}")
+
+@router.get("/recommend", dependencies=[Depends(catalog_etag("psus"))])
+async def recommend_psus(
+    catalog: CatalogDep,
+    min_watts: int = Query(ge=0),
+    limit: int = Query(5, ge=1, le=100),
+    max_headroom: Optional[int] = Query(None, ge=0),
+):
+    try:
+        max_watts = min_watts + max_headroom if max_headroom is not None else None
+        psus = catalog.snapshot["psus"].at_least(min_watts, limit, max_watts)
+        return {"success": True, "data": psus}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error recommending PSUs: {str(e)}")
+
+@router.get("/{psu_name}", dependencies=[Depends(catalog_etag("psus"))])
+async def get_psu_by_name(psu_name: str, session: ReadSessionDep, limit: Optional[int] = Query(None, ge=1)):
+    try:
+        psus = await search_by_name(session, PSU, psu_name, limit)
+        if not psus:
+            raise HTTPException(status_code=404, detail="PSUs not found")
+        return {"success": True, "data": psus}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching PSUs: {str(e)}")
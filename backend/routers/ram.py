@@ -1,43 +1,60 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from backend.dependencies import SessionDep
-from backend.database.models import RAM
-from backend.schemas.schemas import RAMCreate
-
-router = APIRouter(prefix="/ram", tags=["RAM"])
-
-@router.post("/")
-async def create_ram(ram_data: RAMCreate, session: SessionDep):
-    try:
-        ram = RAM(**ram_data.model_dump())
-        session.add(ram)
-        await session.commit()
-        await session.refresh(ram)
-        return {"success": True, "data": ram}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating RAM: {str(e)}")
-
-@router.get("/")
-async def get_ram(session: SessionDep):
-    try:
-        result = await session.execute(select(RAM))
-        ram = result.scalars().all()
-        return {"success": True, "data": ram}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching RAM: {str(e)}")
-
-@router.get("/{ram_name}")
-async def get_ram_by_name(ram_name: str, session: SessionDep):
-    try:
-        result = await session.execute(
-            select(RAM).where(RAM.name.ilike(f"%{ram_name}%"))
-        )
-        ram = result.scalars().all()
-        if not ram:
-            raise HTTPException(status_code=404, detail="RAM not found")
-        return {"success": True, "data": ram}
-    except HTTPException:
-        raise
-    except Exception as e:
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from backend.dependencies import SessionDep, ReadSessionDep, CatalogDep, ListParamsDep, catalog_etag
+from backend.database.models import RAM
+from backend.database.versions import bump_versions
+from backend.database.bulk import bulk_upsert
+from backend.database.fts import search_by_name
+from backend.schemas.schemas import RAMCreate
+
+router = APIRouter(prefix="/ram", tags=["RAM"])
+
+@router.post("/")
+async def create_ram(ram_data: RAMCreate, session: SessionDep, catalog: CatalogDep):
+    try:
+        ram = RAM(**ram_data.model_dump())
+        session.add(ram)
+        await bump_versions(session, ["ram"])
+        await session.commit()
+        await session.refresh(ram)
+        await catalog.reload()
+        return {"success": True, "data": ram}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating RAM: {str(e)}")
+
+@router.post("/bulk")
+async def create_ram_bulk(ram_data: List[RAMCreate], session: SessionDep, catalog: CatalogDep):
+    try:
+        inserted, updated = await bulk_upsert(session, RAM, [item.model_dump() for item in ram_data])
+        await bump_versions(session, ["ram"])
+        await session.commit()
+        await catalog.reload()
+        return {"success": True, "inserted": inserted, "updated": updated}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error bulk creating RAM: {str(e)}")
+
+@router.get("/", dependencies=[Depends(catalog_etag("ram"))])
+async def get_ram(request: Request, catalog: CatalogDep, params: ListParamsDep):
+    try:
+        if params.is_full:
+            return catalog.snapshot.list_response(request, "ram")
+        ram, next_after = catalog.snapshot["ram"].page(params.after, params.limit, params.fields)
+        return {"success": True, "data": ram, "next_after": next_after}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching RAM: {str(e)}")
+
+@router.get("/{ram_name}", dependencies=[Depends(catalog_etag("ram"))])
+async def get_ram_by_name(ram_name: str, session: ReadSessionDep, limit: Optional[int] = Query(None, ge=1)):
+    try:
+        ram = await search_by_name(session, RAM, ram_name, limit)
+        if not ram:
+            raise HTTPException(status_code=404, detail="RAM not found")
+        return {"success": True, "data": ram}
+    except HTTPException:
+        raise
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching RAM: {str(e)}")
\ No newline at end of file
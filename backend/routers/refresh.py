@@ -0,0 +1,14 @@
+from fastapi import APIRouter, HTTPException
+from backend.dependencies import RefreshDep
+
+router = APIRouter(prefix="/refresh", tags=["Refresh"])
+
+@router.post("/")
+async def start_refresh(manager: RefreshDep):
+    if not manager.start():
+        raise HTTPException(status_code=409, detail="Refresh is already running")
+    return {"success": True, "data": manager.status()}
+
+@router.get("/status")
+async def get_refresh_status(manager: RefreshDep):
+    return {"success": True, "data": manager.status()}
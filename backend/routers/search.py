@@ -0,0 +1,19 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from dependencies import CatalogDep, catalog_etag
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+@router.get("/", dependencies=[Depends(catalog_etag())])
+async def search_components(
+    catalog: CatalogDep,
+    q: str = Query(..., min_length=1),
+    category: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    try:
+        return {"success": True, "data": catalog.snapshot.typeahead(q, category, limit)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching components: {str(e)}")
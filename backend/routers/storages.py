@@ -1,58 +1,78 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from backend.dependencies import SessionDep
-from backend.database.models import Storage
-from backend.schemas.schemas import StorageCreate
-
-router = APIRouter(prefix="/storages", tags=["Storages"])
-
-@router.post("/")
-async def create_storage(storage_data: StorageCreate, session: SessionDep):
-    try:
-        storage = Storage(**storage_data.model_dump())
-        session.add(storage)
-        await session.commit()
-        await session.refresh(storage)
-        return {"success": True, "data": storage}
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating Storage: {str(e)}")
-
-@router.get("/")
-async def get_storages(session: SessionDep):
-    try:
-        result = await session.execute(select(Storage))
-        storages = result.scalars().all()
-        return {"success": True, "data": storages}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching storages: {str(e)}")
-#
-# @router.get("/{storage_name}")
-# async def get_storage_by_name(storage_name: str, session: SessionDep):
-#     try:
-#         result = await session.execute(
-#             select(Storage).where(Storage.name.ilike(f"%{storage_name}%"))
-#         )
-#         storages = result.scalars().all()
-#         if not storages:
-#             raise HTTPException(status_code=404, detail="Storages not found")
-#         return {"success": True, "data": storages}
-#     except HTTPException:
-#         raise
-#     except Exception as e:
-#         raise HTTPException(status_code=500, detail=f"Error fetching Storages: {str(e)}")
-#
-# @router.get('/{type}/{number}')
-# async def get_storage_by_type(type: str, number: int, session: SessionDep):
-#     try:
-#         result = await session.execute(
-#             select(Storage).where(Storage.name.ilike(f"%{type}%"))
-#         )
-#         storages = result.scalars().all()
-#         if not storages:
-#             raise HTTPException(status_code=404, detail="Storage not found")
-#         return {"success": True, "data": storages}
-#     except HTTPException:
-#         raise
-#     except Exception as e:
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from backend.dependencies import SessionDep, CatalogDep, ListParamsDep, catalog_etag
+from backend.database.models import Storage
+from backend.database.versions import bump_versions
+from backend.database.bulk import bulk_upsert
+from backend.schemas.schemas import StorageCreate
+
+router = APIRouter(prefix="/storages", tags=["Storages"])
+
+@router.post("/")
+async def create_storage(storage_data: StorageCreate, session: SessionDep, catalog: CatalogDep):
+    try:
+        storage = Storage(**storage_data.model_dump())
+        session.add(storage)
+        await bump_versions(session, ["storages"])
+        await session.commit()
+        await session.refresh(storage)
+        await catalog.reload()
+        return {"success": True, "data": storage}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating Storage: {str(e)}")
+
+@router.post("/bulk")
+async def create_storages_bulk(storage_data: List[StorageCreate], session: SessionDep, catalog: CatalogDep):
+    try:
+        inserted, updated = await bulk_upsert(session, Storage, [item.model_dump() for item in storage_data])
+        await bump_versions(session, ["storages"])
+        await session.commit()
+        await catalog.reload()
+        return {"success": True, "inserted": inserted, "updated": updated}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Error bulk creating Storages: {str(e)}")
+
+@router.get("/", dependencies=[Depends(catalog_etag("storages"))])
+async def get_storages(request: Request, catalog: CatalogDep, params: ListParamsDep):
+    try:
+        if params.is_full:
+            return catalog.snapshot.list_response(request, "storages")
+        storages, next_after = catalog.snapshot["storages"].page(params.after, params.limit, params.fields)
+        return {"success": True, "data": storages, "next_after": next_after}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching storages: {str(e)}")
+#
+# @router.get("/{storage_name}")
+# async def get_storage_by_name(storage_name: str, session: SessionDep):
+#     try:
+#         result = await session.execute(
+#             select(Storage).where(Storage.name.ilike(f"%{storage_name}%"))
+#         )
+#         storages = result.scalars().all()
+#         if not storages:
+#             raise HTTPException(status_code=404, detail="Storages not found")
+#         return {"success": True, "data": storages}
+#     except HTTPException:
+#         raise
+#     except Exception as e:
+#         raise HTTPException(status_code=500, detail=f"Error fetching Storages: {str(e)}")
+#
+# @router.get('/{type}/{number}')
+# async def get_storage_by_type(type: str, number: int, session: SessionDep):
+#     try:
+#         result = await session.execute(
+#             select(Storage).where(Storage.name.ilike(f"%{type}%"))
+#         )
+#         storages = result.scalars().all()
+#         if not storages:
+#             raise HTTPException(status_code=404, detail="Storage not found")
+#         return {"success": True, "data": storages}
+#     except HTTPException:
+#         raise
+#     except Exception as e:
 #         raise HTTPException(status_code=500, detail=f"Error fetching Storage: {str(e)}")
\ No newline at end of file
@@ -1,34 +1,47 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
-from backend.database.database import engine, Base
-from backend.database.models import CPU, GPU, RAM, Storage, Cooling, Drive, Motherboard
-
-router = APIRouter(tags=["System"])
-
-@router.post("/setup_database")
-async def setup_database():
-    try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
-            await conn.run_sync(Base.metadata.create_all)
-        return {"success": True, "message": "database created"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Database setup error: {str(e)}")
-
-@router.get("/health")
-async def health_check():
-    try:
-        async with engine.connect() as conn:
-            await conn.execute(select(1))
-        return {"status": "healthy", "database": "connected"}
-    except Exception as e:
-        return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
-
-@router.get("/test_connection")
-async def test_connection():
-    try:
-        async with engine.begin() as conn:
-            await conn.execute(select(1))
-        return {"status": "success", "message": "Database connection successful"}
-    except Exception as e:
+from fastapi import APIRouter, HTTPException
+from sqlalchemy import select
+from backend.database.database import engine, Base
+from backend.database.migrations import run_migrations
+from backend.database.models import Component
+from backend.database.refresh import clear_state
+from backend.database.versions import bump_versions
+from backend.dependencies import CatalogDep
+from backend.catalog import CATEGORIES
+
+router = APIRouter(tags=["System"])
+
+@router.post("/setup_database")
+async def setup_database(catalog: CatalogDep):
+    try:
+        # catalog_versions не пересоздаётся, чтобы версии каталога оставались монотонными;
+        # представления категорий остаются и после пересоздания components снова работают
+        tables = [Component.__table__]
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all, tables=tables)
+            await conn.run_sync(Base.metadata.create_all, tables=tables)
+            await conn.run_sync(run_migrations)
+            # Иначе следующее обновление сочтёт страницы источников неизменными и не заполнит каталог
+            await clear_state(conn, CATEGORIES)
+            await bump_versions(conn, CATEGORIES)
+        await catalog.reload()
+        return {"success": True, "message": "database created"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database setup error: {str(e)}")
+
+@router.get("/health")
+async def health_check():
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(select(1))
+        return {"status": "healthy", "database": "connected"}
+    except Exception as e:
+        return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
+
+@router.get("/test_connection")
+async def test_connection():
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(select(1))
+        return {"status": "success", "message": "Database connection successful"}
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database connection failed: {str(e)}")
\ No newline at end of file
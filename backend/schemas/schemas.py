@@ -1,34 +1,47 @@
-from pydantic import BaseModel
-
-class ComponentCreate(BaseModel):
-    name: str
-
-
-class CPUCreate(ComponentCreate):
-    consumption: float
-    pass
-
-class GPUCreate(ComponentCreate):
-    consumption: float
-    pass
-
-class RAMCreate(ComponentCreate):
-    consumption: float
-    pass
-
-class PSUCreate(ComponentCreate):
-    wattage: float
-    pass
-
-class StorageCreate(ComponentCreate):
-    consumption: float
-    type: str
-
-class CoolingCreate(ComponentCreate):
-    consumption: int
-
-class DriveCreate(ComponentCreate):
-    consumption: int
-
-class MotherboardCreate(ComponentCreate):
-    consumption: int
+from typing import List, Optional
+from pydantic import BaseModel
+
+class ComponentCreate(BaseModel):
+    name: str
+
+
+class CPUCreate(ComponentCreate):
+    consumption: float
+    pass
+
+class GPUCreate(ComponentCreate):
+    consumption: float
+    pass
+
+class RAMCreate(ComponentCreate):
+    consumption: float
+    pass
+
+class PSUCreate(ComponentCreate):
+    wattage: float
+    pass
+
+class StorageCreate(ComponentCreate):
+    consumption: float
+    type: str
+
+class CoolingCreate(ComponentCreate):
+    consumption: int
+
+class DriveCreate(ComponentCreate):
+    consumption: int
+
+class MotherboardCreate(ComponentCreate):
+    consumption: int
+
+
+class CalculationRequest(BaseModel):
+    cpu_name: Optional[str] = None
+    gpu_name: Optional[str] = None
+    ram_name: Optional[str] = None
+    ram_modules: int = 1
+    storage_names: List[str] = []
+    cooling_name: Optional[str] = None
+    drive_name: Optional[str] = None
+    motherboard_name: Optional[str] = None
+    power_margin: int = 20
@@ -0,0 +1,309 @@
+"""
+Индекс названий для подсказок при вводе (GET /search).
+
+Названия нормализуются: нижний регистр, слова — последовательности
+букв и цифр. Для каждой категории строятся:
+
+* отсортированный массив нормализованных названий — совпадения по
+  началу названия находятся двумя bisect;
+* словарь слов с инвертированным индексом — номера записей, в которых
+  встречается слово, лежат одним плоским массивом в порядке словаря,
+  поэтому все слова с общим началом дают один непрерывный срез.
+
+Запрос "rtx 4070" находит записи, у которых каждое слово запроса —
+начало какого-то слова названия ("NVIDIA GeForce RTX 4070 Ti").
+Записи пронумерованы по рангу (короче название — выше, затем по
+алфавиту), поэтому отсортированный срез индекса уже упорядочен по
+рангу, и перебор кандидатов останавливается на limit найденных.
+Кандидатов даёт самое редкое слово запроса, остальные проверяются
+по словам записи.
+
+Для поиска подстроки (containing, first_containing) отдельно строится
+индекс n-грамм названий в нижнем регистре длиной от 1 до GRAM символов:
+запрос не длиннее GRAM — один срез индекса, для длинного запроса
+кандидаты — пересечение срезов его n-грамм, которое проверяется `in`.
+"""
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r"[^\W_]+")
+# Больше любого символа названия: [prefix, prefix + _END) — все строки с началом prefix
+_END = "\U0010ffff"
+# Диапазоны индекса от этого размера сливаются один раз и кэшируются
+MERGE_CACHE_MIN = 2048
+# Длина n-грамм индекса подстрок
+GRAM = 3
+# Пересечение срезов n-грамм прекращается, когда кандидатов не больше этого
+VERIFY_MAX = 64
+# Код символа, которым n-грамма короче GRAM дополняется в _pack (больше любого символа Unicode)
+_PAD = 0x1FFFFF
+
+# Ключ сортировки результата: (0 — совпало начало названия, 1 — начала слов), длина, название
+SearchKey = Tuple[int, int, str]
+
+
+def _pack(chars):
+    """n-грамма (коды GRAM символов) одним int64: по 21 биту на символ"""
+    key = 0
+    for char in chars:
+        key = (key << 21) | char
+    return key
+
+
+def words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+class NameIndex:
+    """Индекс по началу названия и по началам слов для одной категории"""
+
+    def __init__(self, names: Sequence[str]):
+        self._names = names
+        # rank -> позиция записи в names
+        self._positions = np.array(sorted(range(len(names)), key=lambda i: (len(names[i]), names[i])),
+                                   dtype=np.int64)
+        record_words = [words(names[i]) for i in self._positions]
+
+        normalized = sorted((" ".join(w), rank) for rank, w in enumerate(record_words))
+        self._keys = [key for key, _ in normalized]
+        self._key_ranks = np.array([rank for _, rank in normalized], dtype=np.int32)
+
+        postings: Dict[str, List[int]] = {}
+        for rank, w in enumerate(record_words):
+            for word in dict.fromkeys(w):
+                postings.setdefault(word, []).append(rank)
+        self._vocab = sorted(postings)
+        word_ids = {word: i for i, word in enumerate(self._vocab)}
+        # Записи слова vocab[i] — postings[offsets[i]:offsets[i + 1]], по возрастанию ранга
+        self._offsets = np.zeros(len(self._vocab) + 1, dtype=np.int64)
+        np.cumsum([len(postings[word]) for word in self._vocab], out=self._offsets[1:])
+        self._postings = np.fromiter((rank for word in self._vocab for rank in postings[word]),
+                                     dtype=np.int32, count=int(self._offsets[-1]))
+        # Номера слов записи rank — record_words[record_offsets[rank]:record_offsets[rank + 1]]
+        self._record_offsets = np.zeros(len(record_words) + 1, dtype=np.int64)
+        np.cumsum([len(w) for w in record_words], out=self._record_offsets[1:])
+        self._record_words = np.fromiter((word_ids[word] for w in record_words for word in w),
+                                         dtype=np.int32, count=int(self._record_offsets[-1]))
+        # Отсортированные номера записей для больших диапазонов, см. _ranks()
+        self._merged: Dict[Tuple[str, int, int], np.ndarray] = {}
+        # Индекс подстрок, см. build_substrings()
+        self._lowered: Optional[List[str]] = None
+        self._gram_ids: Dict[int, int] = {}
+        self._gram_offsets = self._gram_postings = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _ranks(self, kind: str, source: np.ndarray, lo: int, hi: int, single: bool) -> np.ndarray:
+        """Уникальные номера записей source[lo:hi] по возрастанию ранга"""
+        if single:
+            # Срез одного слова уже отсортирован и без повторов
+            return source[lo:hi]
+        if hi - lo < MERGE_CACHE_MIN:
+            return np.unique(source[lo:hi])
+        # Короткие начала слов ("r", "rt") покрывают большую часть индекса:
+        # слияние для них считается один раз на снимок
+        key = (kind, lo, hi)
+        merged = self._merged.get(key)
+        if merged is None:
+            merged = self._merged[key] = np.unique(source[lo:hi])
+        return merged
+
+    def _prefix_ranks(self, query: str) -> np.ndarray:
+        lo = bisect_left(self._keys, query)
+        hi = bisect_left(self._keys, query + _END, lo)
+        return self._ranks("name", self._key_ranks, lo, hi, hi - lo <= 1)
+
+    def _word_range(self, prefix: str) -> Tuple[int, int]:
+        """Диапазон номеров слов словаря, начинающихся с prefix"""
+        lo = bisect_left(self._vocab, prefix)
+        return lo, bisect_left(self._vocab, prefix + _END, lo)
+
+    def _matches(self, ranks: np.ndarray, word_range: Tuple[int, int]) -> np.ndarray:
+        """Маска записей ranks, у которых есть слово из word_range"""
+        starts = self._record_offsets[ranks]
+        lengths = self._record_offsets[ranks + 1] - starts
+        owner = np.repeat(np.arange(len(ranks)), lengths)
+        flat = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths) \
+            + np.repeat(starts, lengths)
+        ids = self._record_words[flat]
+        hits = (ids >= word_range[0]) & (ids < word_range[1])
+        return np.bincount(owner[hits], minlength=len(ranks)) > 0
+
+    def build_substrings(self):
+        """Построить индекс подстрок; без вызова строится при первом поиске подстроки"""
+        if self._lowered is not None:
+            return
+        lowered = [name.lower() for name in self._names]
+        # Коды символов всех названий подряд, после каждого — разделитель 0
+        chars = np.frombuffer("".join(name + "\0" for name in lowered).encode("utf-32-le"), dtype=np.uint32)
+        chars = np.concatenate([chars.astype(np.int64), np.zeros(GRAM, dtype=np.int64)])
+        owner = np.repeat(np.arange(len(lowered), dtype=np.int32), [len(name) + 1 for name in lowered])
+        keys, positions = [], []
+        for n in range(1, GRAM + 1):
+            windows = [chars[k:k + len(owner)] for k in range(n)]
+            valid = np.logical_and.reduce([w != 0 for w in windows])
+            keys.append(_pack(windows + [_PAD] * (GRAM - n))[valid])
+            positions.append(owner[valid])
+        keys, positions = np.concatenate(keys), np.concatenate(positions)
+        order = np.lexsort((positions, keys))
+        keys, positions = keys[order], positions[order]
+        # Повторы n-граммы в одном названии
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = (keys[1:] != keys[:-1]) | (positions[1:] != positions[:-1])
+        keys, positions = keys[first], positions[first]
+        # Позиции n-граммы с ключом key — postings[offsets[i]:offsets[i + 1]] для i = gram_ids[key],
+        # по возрастанию
+        unique, starts = np.unique(keys, return_index=True)
+        self._gram_ids = dict(zip(unique.tolist(), range(len(unique))))
+        self._gram_offsets = np.append(starts, len(keys))
+        self._gram_postings = positions
+        self._lowered = lowered
+
+    def _substring_candidates(self, query: str) -> np.ndarray:
+        """Позиции по возрастанию; для запроса длиннее GRAM — надмножество совпадений"""
+        self.build_substrings()
+        slices = []
+        for gram in {query[i:i + GRAM] for i in range(max(len(query) - GRAM + 1, 1))}:
+            i = self._gram_ids.get(_pack([ord(c) for c in gram] + [_PAD] * (GRAM - len(gram))))
+            if i is None:
+                return self._gram_postings[:0]
+            slices.append(self._gram_postings[self._gram_offsets[i]:self._gram_offsets[i + 1]])
+        slices.sort(key=len)
+        candidates = slices[0]
+        for positions in slices[1:]:
+            if len(candidates) <= VERIFY_MAX:
+                break
+            candidates = np.intersect1d(candidates, positions, assume_unique=True)
+        return candidates
+
+    def containing(self, text: str) -> List[int]:
+        """Позиции (по возрастанию) названий, содержащих text без учёта регистра"""
+        query = text.lower()
+        if not query:
+            return list(range(len(self._names)))
+        candidates = self._substring_candidates(query).tolist()
+        if len(query) <= GRAM:
+            return candidates
+        return [position for position in candidates if query in self._lowered[position]]
+
+    def first_containing(self, text: str) -> Optional[int]:
+        """Наименьшая позиция названия, содержащего text без учёта регистра"""
+        query = text.lower()
+        if not query:
+            return 0 if len(self._names) else None
+        for position in self._substring_candidates(query).tolist():
+            if len(query) <= GRAM or query in self._lowered[position]:
+                return position
+        return None
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[SearchKey, int]]:
+        """
+        До limit лучших записей для строки запроса.
+
+        Returns:
+            Пары (ключ сортировки, позиция записи в names); ключи
+            сравнимы между индексами разных категорий
+        """
+        query_words = words(query)
+        if not query_words or not len(self._names):
+            return []
+
+        prefix = self._prefix_ranks(" ".join(query_words))[:limit]
+        found = [(0, rank) for rank in prefix.tolist()]
+        if len(found) < limit:
+            ranges = [self._word_range(word) for word in query_words]
+            sizes = [self._offsets[hi] - self._offsets[lo] for lo, hi in ranges]
+            driver = int(np.argmin(sizes))
+            lo, hi = ranges[driver]
+            candidates = self._ranks("words", self._postings, int(self._offsets[lo]), int(self._offsets[hi]),
+                                     hi - lo <= 1)
+            rest = [r for i, r in enumerate(ranges) if i != driver]
+            # Кандидаты уже упорядочены по рангу: проверяются порциями до limit найденных
+            chunk, start = 4 * limit, 0
+            while start < len(candidates) and len(found) < limit:
+                ranks = candidates[start:start + chunk]
+                mask = ~np.isin(ranks, prefix)
+                for word_range in rest:
+                    mask &= self._matches(ranks, word_range)
+                found.extend((1, rank) for rank in ranks[mask][:limit - len(found)].tolist())
+                start += chunk
+                chunk *= 4
+
+        result = []
+        for group, rank in found:
+            position = int(self._positions[rank])
+            name = self._names[position]
+            result.append(((group, len(name), name), position))
+        return result
+
+
+if __name__ == "__main__":
+    # Бенчмарк: python -m backend.typeahead [число синтетических названий]
+    import random
+    import sqlite3
+    import sys
+    import time
+
+    from backend.database.database import db_path
+
+    def catalog_names() -> List[str]:
+        conn = sqlite3.connect(db_path)
+        try:
+            tables = ("cpus", "gpus", "psus", "ram", "storages", "cooling", "drives", "motherboards")
+            return [name for table in tables for (name,) in conn.execute(f"SELECT name FROM {table}")]
+        finally:
+            conn.close()
+
+    def synthetic_names(n: int) -> List[str]:
+        rng = random.Random(23)
+        brands = ["NVIDIA GeForce RTX", "AMD Radeon RX", "Intel Core i", "AMD Ryzen", "Corsair RM", "Seasonic Focus"]
+        suffixes = ["", " Ti", " SUPER", " XT", "K", "X3D", " Gold", " 16GB", " OC Edition"]
+        return [f"{rng.choice(brands)} {rng.randint(100, 99999)}{rng.choice(suffixes)} rev{i}" for i in range(n)]
+
+    def substring_scan(names, query, limit):
+        # Прежний способ: полный перебор названий с поиском подстроки
+        q = query.lower()
+        return [name for name in names if q in name.lower()][:limit]
+
+    def brute_force(names, query, limit):
+        q = words(query)
+        keys = []
+        for position, name in enumerate(names):
+            w = words(name)
+            if " ".join(w).startswith(" ".join(q)):
+                keys.append(((0, len(name), name), position))
+            elif all(any(x.startswith(y) for x in w) for y in q):
+                keys.append(((1, len(name), name), position))
+        return [name for (_, _, name), _ in sorted(keys)[:limit]]
+
+    queries = ["rtx 4070", "ryzen 7", "i7", "corsair rm", "4090", "r", "radeon rx 7", "focus gold", "zzz"]
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [None, 100_000, 1_000_000]
+    for size in sizes:
+        names = catalog_names() if size is None else synthetic_names(size)
+        started = time.perf_counter()
+        index = NameIndex(names)
+        built = time.perf_counter() - started
+        print(f"{len(names)} names ({'catalog' if size is None else 'synthetic'}), index built in {built:.2f} s")
+        for query in queries:
+            started = time.perf_counter()
+            hits = index.search(query, 20)
+            first = time.perf_counter() - started
+            if len(names) <= 100_000:
+                assert [names[p] for _, p in hits] == brute_force(names, query, 20), f"{query!r} differs"
+                assert index.containing(query) == [p for p, n in enumerate(names) if query in n.lower()], \
+                    f"{query!r} substrings differ"
+            rounds = 200
+            started = time.perf_counter()
+            for _ in range(rounds):
+                index.search(query, 20)
+            elapsed = (time.perf_counter() - started) / rounds
+            started = time.perf_counter()
+            substring_scan(names, query, 20)
+            scan = time.perf_counter() - started
+            top = names[hits[0][1]] if hits else "-"
+            print(f"  {query!r:14s} {elapsed * 1e6:8.1f} us (first {first * 1e3:6.2f} ms, substring scan "
+                  f"{scan * 1e3:6.2f} ms)  {len(hits):2d} hits, top: {top}")
@@ -1,178 +1,188 @@
-from __future__ import annotations
-import logging
-import re
-import lxml
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
-
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-from bs4 import BeautifulSoup
-import pandas as pd
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-DEFAULT_MAX_WORKERS = 8
-REQUESTS_TIMEOUT = 15.0
-DEFAULT_DELAY = 0.1
-
-
-def main():
-    def _requests_session(max_retries: int = 3, pool_connections: int = 100,
-                          pool_maxsize: int = 100) -> requests.Session:
-        s = requests.Session()
-        retries = Retry(total=max_retries, backoff_factor=0.3,
-                        status_forcelist=(429, 500, 502, 503, 504),
-                        allowed_methods=frozenset(["GET", "POST"]))
-        adapter = HTTPAdapter(max_retries=retries, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
-        s.mount("https://", adapter)
-        s.mount("http://", adapter)
-        s.headers.update({
-            "User-Agent": "Mozilla/5.0 (compatible; CPU-Scraper/1.0; +https://example.local)",
-            "Accept": "text/html,application/json,application/xhtml+xml,*/*;q=0.9",
-            "Accept-Language": "en-US,en;q=0.9",
-            "X-Requested-With": "XMLHttpRequest",
-        })
-        return s
-
-    def _parse_cpu_table(html: str, brand_name: str) -> List[Dict[str, Optional[str]]]:
-        soup = BeautifulSoup(html, "lxml")
-        rows = []
-        tables = soup.find_all("table")
-        for table in tables:
-            thead = table.find("thead")
-            if not thead:
-                continue
-            headers = [th.get_text(strip=True) for th in thead.find_all("th")]
-            header_idx = {name: i for i, name in enumerate(headers)}
-            tbody = table.find("tbody")
-            if not tbody:
-                continue
-            for tr in tbody.find_all("tr"):
-                tds = tr.find_all("td")
-                if len(tds) != len(headers):
-                    continue
-                row = {}
-                for name, i in header_idx.items():
-                    val = tds[i].get_text(strip=True)
-                    row[name] = val
-
-                if 'CPU' in row or 'Model' in row or 'Processor' in row:
-                    name_columns = ['CPU', 'Model', 'Processor', 'Name']
-                    for col in name_columns:
-                        if col in row and row[col]:
-                            if brand_name.lower() not in row[col].lower():
-                                row[col] = f"{brand_name} {row[col]}"
-                            break
-
-                rows.append(row)
-        return rows
-
-    def parse_cpu_brand(base_url: str, brand_name: str) -> pd.DataFrame:
-        session = _requests_session()
-        logger.info(f"Getting page count for {brand_name}...")
-        max_page = 50
-        logger.info(f"{brand_name}: Total pages: {max_page}")
-
-        urls = [f"{base_url}?&pg={i}" for i in range(1, max_page + 1)]
-        rows: List[Dict[str, Optional[str]]] = []
-
-        def fetch(url):
-            try:
-                resp = session.get(url, timeout=REQUESTS_TIMEOUT)
-                parsed = _parse_cpu_table(resp.text, brand_name)
-                logger.info(f"Fetched {url}, found rows: {len(parsed)}")
-                return parsed
-            except Exception as e:
-                logger.warning(f"Failed to fetch {url}: {e}")
-                return []
-
-        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as ex:
-            for rows_chunk in ex.map(fetch, urls):
-                if rows_chunk:
-                    rows.extend(rows_chunk)
-
-        df = pd.DataFrame(rows)
-        if not df.empty:
-            df = df.loc[:, ~df.columns.duplicated()].copy()
-            df['Brand'] = brand_name
-            logger.info(f"{brand_name}: Successfully parsed {len(df)} rows")
-
-            name_columns = ['CPU', 'Model', 'Processor', 'Name']
-            for col in name_columns:
-                if col in df.columns:
-                    sample_names = df[col].head(3).tolist()
-                    logger.info(f"{brand_name} sample processor names: {sample_names}")
-                    break
-        else:
-            logger.warning(f"{brand_name}: No data found")
-
-        return df
-
-    def parse_all_cpus() -> pd.DataFrame:
-        brands = [
-            {
-                'url': 'https://technical.city/en/cpu/intel-rating',
-                'name': 'Intel'
-            },
-            {
-                'url': 'https://technical.city/en/cpu/amd-rating',
-                'name': 'AMD'
-            }
-        ]
-
-        all_dataframes = []
-
-        for brand in brands:
-            logger.info(f"=== Starting to parse {brand['name']} CPUs ===")
-            try:
-                df_brand = parse_cpu_brand(brand['url'], brand['name'])
-                if not df_brand.empty:
-                    all_dataframes.append(df_brand)
-                    logger.info(f"=== {brand['name']} parsing completed: {len(df_brand)} rows ===")
-                else:
-                    logger.warning(f"=== {brand['name']} parsing failed: no data ===")
-            except Exception as e:
-                logger.error(f"=== Error parsing {brand['name']}: {e} ===")
-                continue
-
-        if all_dataframes:
-            combined_df = pd.concat(all_dataframes, ignore_index=True)
-            logger.info(f"=== Combined data: {len(combined_df)} total rows ===")
-            return combined_df
-        else:
-            logger.error("=== No data was parsed from any brand ===")
-            return pd.DataFrame()
-
-    df = parse_all_cpus()
-
-    if not df.empty:
-        filename = "technical_city_all_cpu_ratings.csv"
-        df.to_csv(filename, index=False)
-        logger.info(f"All data saved to {filename}")
-
-        brand_counts = df['Brand'].value_counts()
-        logger.info("=== Final statistics ===")
-        for brand, count in brand_counts.items():
-            logger.info(f"{brand}: {count} processors")
-
-        name_columns = ['CPU', 'Model', 'Processor', 'Name']
-        for col in name_columns:
-            if col in df.columns:
-                logger.info("=== Sample processor names ===")
-                sample_data = df[[col, 'Brand']].head(5)
-                for _, row in sample_data.iterrows():
-                    logger.info(f"  {row[col]} ({row['Brand']})")
-                break
-    else:
-        logger.warning("No data to save")
-
-    return df
-
-
-if __name__ == "__main__":
-    result = main()
+from __future__ import annotations
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Dict, Optional
+
+import pandas as pd
+
+from backend.parsing import table_extract
+from backend.parsing.crawler import Crawler, crawl_pages, discover_last_page, run
+from backend.parsing.http_cache import HTTP_CACHE_FILE
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; CPU-Scraper/1.0; +https://example.local)"}
+
+NAME_COLUMNS = ['CPU', 'Model', 'Processor', 'Name']
+POWER_KEYWORDS = ('tdp', 'power', 'wattage')
+
+BRANDS = [
+    {
+        'url': 'https://technical.city/en/cpu/intel-rating',
+        'name': 'Intel'
+    },
+    {
+        'url': 'https://technical.city/en/cpu/amd-rating',
+        'name': 'AMD'
+    }
+]
+
+
+def _parse_cpu_table(html: str, brand_name: str) -> List[Dict[str, Optional[str]]]:
+    rows = []
+    for table in table_extract.tables(html):
+        if table.find("thead") is None or table.find("tbody") is None:
+            continue
+        headers = table_extract.header(table)
+
+        # Из таблицы берутся только колонки с названием и мощностью; при
+        # повторе заголовка, как и раньше, — последняя колонка с ним
+        header_idx = {name: i for i, name in enumerate(headers)}
+        columns = {col: header_idx[col] for col in NAME_COLUMNS if col in header_idx}
+        power_idx = table_extract.find_column(headers, *POWER_KEYWORDS)
+        if power_idx is not None:
+            columns.setdefault(headers[power_idx], header_idx[headers[power_idx]])
+        if not columns:
+            continue
+        add_brand = 'CPU' in columns or 'Model' in columns or 'Processor' in columns
+
+        for tr in table.find("tbody").iterfind("tr"):
+            tds = table_extract.row_cells(tr)
+            if len(tds) != len(headers):
+                continue
+            row = {col: table_extract.text(tds[i]) for col, i in columns.items()}
+
+            if add_brand:
+                for col in NAME_COLUMNS:
+                    if col in row and row[col]:
+                        if brand_name.lower() not in row[col].lower():
+                            row[col] = f"{brand_name} {row[col]}"
+                        break
+
+            rows.append(row)
+    return rows
+
+
+async def stream_cpu_brand(crawler: Crawler, base_url: str, brand_name: str,
+                           sink: Callable[[int, List[Dict[str, Optional[str]]]], Awaitable[None]]):
+    """Передавать номер и строки каждой страницы бренда в sink по мере загрузки"""
+    def parse_page(html):
+        return _parse_cpu_table(html, brand_name)
+
+    def parse_first_page(html):
+        return {"rows": parse_page(html), "last_page": discover_last_page(html, "pg")}
+
+    async def fetch(page, parse=parse_page, tag="new_cpu_parser.page"):
+        url = f"{base_url}?&pg={page}"
+        parsed = await crawler.get_parsed(url, parse, headers=HEADERS, tag=tag)
+        if parsed is not None:
+            logger.info(f"Fetched {url}")
+        return parsed
+
+    logger.info(f"Getting page count for {brand_name}...")
+    first = await fetch(1, parse_first_page, "new_cpu_parser.first_page")
+    max_page = first["last_page"] if first is not None else None
+    logger.info(f"{brand_name}: Total pages: {max_page or 'unknown'}")
+
+    first_rows = first["rows"] if first is not None else []
+    if first_rows:
+        await sink(1, first_rows)
+    await crawl_pages(fetch, key=lambda row: tuple(row.items()), start_page=2,
+                      last_page=max_page, seen_rows=first_rows, sink=sink)
+
+
+async def stream_all_cpus(crawler: Crawler, sink: Callable[[str, List[Dict[str, Optional[str]]]], Awaitable[None]]):
+    """Передавать строки всех брендов в sink(page, rows), где page вида 'Intel:3'"""
+    async def stream_brand(brand):
+        logger.info(f"=== Starting to parse {brand['name']} CPUs ===")
+        try:
+            await stream_cpu_brand(crawler, brand['url'], brand['name'],
+                                   lambda page, rows: sink(f"{brand['name']}:{page}", rows))
+        except Exception as e:
+            logger.error(f"=== Error parsing {brand['name']}: {e} ===")
+
+    await asyncio.gather(*(stream_brand(brand) for brand in BRANDS))
+
+
+async def parse_cpu_brand(crawler: Crawler, base_url: str, brand_name: str) -> pd.DataFrame:
+    rows: List[Dict[str, Optional[str]]] = []
+
+    async def collect(page, page_rows):
+        rows.extend(page_rows)
+
+    await stream_cpu_brand(crawler, base_url, brand_name, collect)
+
+    df = pd.DataFrame(rows)
+    if not df.empty:
+        df = df.loc[:, ~df.columns.duplicated()].copy()
+        df['Brand'] = brand_name
+        logger.info(f"{brand_name}: Successfully parsed {len(df)} rows")
+
+        for col in NAME_COLUMNS:
+            if col in df.columns:
+                sample_names = df[col].head(3).tolist()
+                logger.info(f"{brand_name} sample processor names: {sample_names}")
+                break
+    else:
+        logger.warning(f"{brand_name}: No data found")
+
+    return df
+
+
+async def parse_all_cpus(crawler: Crawler) -> pd.DataFrame:
+    async def parse_brand(brand):
+        logger.info(f"=== Starting to parse {brand['name']} CPUs ===")
+        try:
+            df_brand = await parse_cpu_brand(crawler, brand['url'], brand['name'])
+        except Exception as e:
+            logger.error(f"=== Error parsing {brand['name']}: {e} ===")
+            return None
+        if df_brand.empty:
+            logger.warning(f"=== {brand['name']} parsing failed: no data ===")
+            return None
+        logger.info(f"=== {brand['name']} parsing completed: {len(df_brand)} rows ===")
+        return df_brand
+
+    # Бренды загружаются одновременно, порядок результатов сохраняется
+    results = await asyncio.gather(*(parse_brand(brand) for brand in BRANDS))
+    all_dataframes = [df for df in results if df is not None]
+
+    if all_dataframes:
+        combined_df = pd.concat(all_dataframes, ignore_index=True)
+        logger.info(f"=== Combined data: {len(combined_df)} total rows ===")
+        return combined_df
+    else:
+        logger.error("=== No data was parsed from any brand ===")
+        return pd.DataFrame()
+
+
+def main():
+    df = run(parse_all_cpus, cache_path=HTTP_CACHE_FILE)
+
+    if not df.empty:
+        filename = "technical_city_all_cpu_ratings.csv"
+        df.to_csv(filename, index=False)
+        logger.info(f"All data saved to {filename}")
+
+        brand_counts = df['Brand'].value_counts()
+        logger.info("=== Final statistics ===")
+        for brand, count in brand_counts.items():
+            logger.info(f"{brand}: {count} processors")
+
+        for col in NAME_COLUMNS:
+            if col in df.columns:
+                logger.info("=== Sample processor names ===")
+                sample_data = df[[col, 'Brand']].head(5)
+                for _, row in sample_data.iterrows():
+                    logger.info(f"  {row[col]} ({row['Brand']})")
+                break
+    else:
+        logger.warning("No data to save")
+
+    return df
+
+
+if __name__ == "__main__":
+    result = main()
     print(f"Parsing completed. Total processors: {len(result) if hasattr(result, 'shape') else 0}")
\ No newline at end of file
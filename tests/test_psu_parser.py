@@ -0,0 +1,46 @@
+"""
+Разбор таблицы PSU cybenetics: lxml-путь против прежнего pd.read_html.
+
+fixtures/cybenetics_psu.html — страница в разметке базы cybenetics.
+"""
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+
+from backend.parsing.psu_parser import TABLE_CLASS, _parse_psu_table
+
+FIXTURE = Path(__file__).parent / "fixtures" / "cybenetics_psu.html"
+# Селектор таблицы, по которому прежний код брал её HTML из браузера
+BROWSER_TABLE_CLASS = "table table-dark table-striped table-hover mytable sub headers1stLine"
+
+
+def read_html_rows(html: str) -> list:
+    """Строки прежнего разбора: pd.read_html без приведения типов, пустые ячейки — None"""
+    width = len(pd.read_html(StringIO(html), attrs={"class": BROWSER_TABLE_CLASS})[0].columns)
+    frame = pd.read_html(
+        StringIO(html),
+        attrs={"class": BROWSER_TABLE_CLASS},
+        converters={i: str for i in range(width)},
+        keep_default_na=False,
+    )[0]
+    return [
+        {str(column): value or None for column, value in row.items()}
+        for row in frame.to_dict("records")
+    ]
+
+
+def test_fixture_has_table():
+    html = FIXTURE.read_text(encoding="utf-8")
+    assert TABLE_CLASS in BROWSER_TABLE_CLASS.split()
+    assert len(_parse_psu_table(html)) == 15
+
+
+def test_lxml_rows_match_read_html():
+    html = FIXTURE.read_text(encoding="utf-8")
+    assert _parse_psu_table(html) == read_html_rows(html)
+
+
+def test_empty_page():
+    assert _parse_psu_table("") == []
+    assert _parse_psu_table("<html><body><p>Service unavailable</p></body></html>") == []